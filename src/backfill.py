@@ -0,0 +1,125 @@
+"""
+Geçmiş haftalar için toplu derleme (backfill).
+
+Tarih aralığı haftalık pencerelere bölünür; her pencere PubMed mindate/maxdate
+ve Google News after:/before: sınırlarıyla paralel çekilir. Sonuçlar pencere
+sırasıyla işlenir, böylece state.json tek bir çalıştırmadaki gibi tutarlı kalır.
+Tamamlanan pencereler state["backfill"] altına yazılır; yarıda kesilen bir
+backfill aynı komutla kaldığı yerden devam eder.
+Backfill URL'leri state["backfill_urls"] içinde ayrı tutulur ve kırpılmaz; canlı
+seen_urls listesine hiç dokunulmaz, böylece backfill güncel kayıtları düşüremez.
+
+Kullanım:
+    python -m src.backfill --from 2025-01-01 --to 2025-12-31 --series skolyoz --workers 4
+
+Not: Yalnızca tarih aralığı destekleyen kaynaklar (source_registry: windowed=True) kullanılır;
+medRxiv ve Cochrane yalnızca güncel RSS/Atom akışı sunduğu için backfill'e dahil değildir.
+"""
+import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+
+from .main import build_series_markdown, dedup_by_url, write_text, safe_ts
+from .source_registry import enabled_sources, fetch_source
+from .state_store import BACKFILL_KEY, load_state, save_state, filter_new
+from .trends import TRENDS_DIR, load_trends, save_trends, update_trends, iso_week
+
+
+def weekly_windows(start: str, end: str) -> List[Tuple[str, str]]:
+    """
+    [start, end] aralığını (dahil) [başlangıç, bitiş) pencerelere böler. Pencereler ISO
+    haftalarına (Pazartesi) hizalıdır: her pencere tek bir haftaya düşer, trend sayıları
+    doğru haftaya yazılır. İlk/son pencere aralık sınırında kısa kalabilir.
+    """
+    d = date.fromisoformat(start)
+    stop = date.fromisoformat(end) + timedelta(days=1)
+    windows = []
+    while d < stop:
+        nxt = min(d + timedelta(days=7 - d.weekday()), stop)
+        windows.append((d.isoformat(), nxt.isoformat()))
+        d = nxt
+    return windows
+
+def fetch_window(series_cfg: Dict[str, Any], window: Tuple[str, str]) -> Optional[List[Dict[str, Any]]]:
+    series_key = series_cfg.get("key", "series")
+    try:
+        items = []
+        for spec in enabled_sources(series_cfg, "series"):
+            if spec.windowed:
+                items += fetch_source(spec, series_cfg[spec.key], window=window)
+    except Exception as e:
+        # Pencere tamamlandı sayılmaz; sonraki çalıştırmada tekrar denenir.
+        print(f"[{series_key}] {window[0]} penceresi çekilemedi:", e)
+        return None
+    return dedup_by_url(items)
+
+def run_backfill(cfg: Dict[str, Any], start: str, end: str, series_keys: List[str], workers: int = 4) -> None:
+    series = [s for s in cfg.get("series", []) if not series_keys or s.get("key") in series_keys]
+    if not series:
+        print("Seçilen seri bulunamadı:", ", ".join(series_keys))
+        return
+
+    state = load_state()
+    done = state.setdefault("backfill", {})
+
+    jobs = []
+    for window in weekly_windows(start, end):
+        for s in series:
+            if window[0] not in done.get(s.get("key", "series"), []):
+                jobs.append((s, window))
+
+    print(f"[BACKFILL] {len(jobs)} pencere işlenecek ({workers} işçi).")
+    if not jobs:
+        return
+
+    ts = safe_ts()
+    trends = load_trends(TRENDS_DIR)
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        results = pool.map(lambda job: fetch_window(*job), jobs)
+        # map sonuçları iş sırasıyla döndürür: state güncellemesi kronolojik ve deterministik.
+        for (s, window), items in zip(jobs, results):
+            if items is None:
+                continue
+            series_key = s.get("key", "series")
+            last_day = (date.fromisoformat(window[1]) - timedelta(days=1)).isoformat()
+
+            fresh = filter_new(items, state, max_keep=None, key=BACKFILL_KEY)
+            if fresh:
+                update_trends(trends, [(series_key, fresh)], iso_week(date.fromisoformat(window[0])))
+                series_title = f"{s.get('title_prefix','Seri')} — Derleme ({window[0]} / {last_day})"
+                file_path = f"out/{series_key}/{last_day}_{ts}.md"
+                write_text(file_path, build_series_markdown(series_title, fresh))
+                print(f"[{series_key}] Yazıldı: {file_path}")
+            else:
+                print(f"[{series_key}] {window[0]} penceresinde yeni içerik yok.")
+
+            done.setdefault(series_key, []).append(window[0])
+            save_state(state)
+            save_trends(trends, TRENDS_DIR)
+    except BaseException:
+        # Ctrl-C / hata: sıradaki pencereler çekilmesin; tamamlananlar zaten kaydedildi.
+        pool.shutdown(wait=False, cancel_futures=True)
+        print("[BACKFILL] Durduruldu; aynı komutla kaldığı yerden devam eder.")
+        raise
+    pool.shutdown()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Geçmiş haftalar için seri derlemesi üretir.")
+    ap.add_argument("--from", dest="start", required=True, help="Başlangıç tarihi (YYYY-MM-DD)")
+    ap.add_argument("--to", dest="end", required=True, help="Bitiş tarihi, dahil (YYYY-MM-DD)")
+    ap.add_argument("--series", action="append", default=[], help="Seri anahtarı (tekrarlanabilir; boşsa tümü)")
+    ap.add_argument("--workers", type=int, default=4, help="Paralel pencere sayısı")
+    args = ap.parse_args()
+
+    with open("config.json", "r", encoding="utf-8") as f:
+        cfg = json.load(f)
+
+    run_backfill(cfg, args.start, args.end, args.series, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
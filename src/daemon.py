@@ -0,0 +1,197 @@
+"""
+Sürekli çalışan zamanlayıcı (daemon) modu.
+
+Her kaynak kendi aralığıyla yoklanır (varsayılan: Google News saatlik, PubMed ve
+medRxiv günlük, Cochrane haftalık, kayıt defterine eklenen diğer kaynaklar günlük); istekler ETag/Last-Modified ile koşulludur.
+Henüz görülmemiş kayıtlar seri başına staging/<seri>.json içinde birikir. Haftalık
+derleme zamanı geldiğinde derleme bu depodan yerel olarak üretilir ve depo boşaltılır.
+
+config.json (isteğe bağlı):
+    "daemon": {
+        "poll_hours": {"google_news": 1, "pubmed": 24, "medrxiv": 24, "cochrane": 168},
+        "emit_weekday": 6,
+        "emit_hour_utc": 7,
+        "tick_seconds": 300
+    }
+emit_weekday: 0=Pazartesi ... 6=Pazar (GitHub Actions cron'u ile aynı: Pazar 07:00 UTC).
+Daemon planlı zamanda kapalıysa kaçırılan derleme yeniden başladığı ilk turda üretilir.
+
+Kullanım:
+    python -m src.main --daemon          # sürekli
+    python -m src.main --daemon --once   # tek tur (cron/test için)
+"""
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any
+
+from .main import (
+    match_global_items, make_series_job, attach_trends, render_all, write_reports, publish_wordpress, deliver_email,
+    dedup_by_url, safe_ts,
+)
+from .source_registry import enabled_sources, fetch_source
+from .state_store import load_state, save_state, known_urls
+from .trends import save_trends
+from .utils import now_utc_iso, conditional_requests
+
+STAGING_DIR = "staging"
+DAEMON_FILE = os.path.join(STAGING_DIR, "_daemon.json")
+
+DEFAULT_POLL_HOURS = {
+    "google_news": 1,
+    "pubmed": 24,
+    "medrxiv": 24,
+    "cochrane": 168,
+}
+
+
+def _load_json(path: str, default: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+def _save_json(path: str, data: Dict[str, Any]) -> None:
+    # Yarım yazılmış dosya kalmasın: önce geçici dosya, sonra rename
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+def _staging_path(series_key: str) -> str:
+    return os.path.join(STAGING_DIR, f"{series_key}.json")
+
+def stage_items(series_key: str, items: List[Dict[str, Any]], state: Dict[str, Any]) -> int:
+    """Staging deposuna henüz görülmemiş kayıtları ekler; eklenen sayıyı döndürür."""
+    if not items:
+        return 0
+    path = _staging_path(series_key)
+    staged = _load_json(path, {"items": []})
+    known = {it["url"] for it in staged["items"]} | known_urls(state)
+    new = [it for it in dedup_by_url(items) if it["url"] not in known]
+    if new:
+        staged["items"].extend(new)
+        _save_json(path, staged)
+    return len(new)
+
+def _is_due(store: Dict[str, Any], key: str, hours: float, now: datetime) -> bool:
+    last = store["last_poll"].get(key)
+    return not last or now - datetime.fromisoformat(last) >= timedelta(hours=hours)
+
+def _fetch(label: str, spec, source_cfg: Dict[str, Any]):
+    try:
+        return fetch_source(spec, source_cfg)
+    except Exception as e:
+        # Bir kaynağın hatası daemon'u durdurmasın; bir sonraki turda yeniden denenir.
+        print(f"[DAEMON] {label} çekilemedi:", e)
+        return None
+
+
+def poll_sources(cfg: Dict[str, Any], store: Dict[str, Any], state: Dict[str, Any], now: datetime) -> None:
+    hours = {**DEFAULT_POLL_HOURS, **cfg.get("daemon", {}).get("poll_hours", {})}
+    series = cfg.get("series", [])
+    global_cfg = cfg.get("global_sources", {})
+
+    for spec in enabled_sources(global_cfg, "global"):
+        if not _is_due(store, spec.key, hours.get(spec.key, 24), now):
+            continue
+        items = _fetch(spec.label, spec, global_cfg[spec.key])
+        if items is None:
+            continue
+        added = sum(stage_items(s.get("key", "series"), match_global_items(s, items), state) for s in series)
+        store["last_poll"][spec.key] = now.isoformat()
+        print(f"[DAEMON] {spec.key}: {len(items)} kayıt, {added} yeni staging'e eklendi.")
+
+    for s in series:
+        series_key = s.get("key", "series")
+        for spec in enabled_sources(s, "series"):
+            key = f"{spec.key}:{series_key}"
+            if not _is_due(store, key, hours.get(spec.key, 24), now):
+                continue
+            items = _fetch(key, spec, s[spec.key])
+            if items is None:
+                continue
+            added = stage_items(series_key, items, state)
+            store["last_poll"][key] = now.isoformat()
+            print(f"[DAEMON] {key}: {len(items)} kayıt, {added} yeni staging'e eklendi.")
+
+def last_emit_slot(cfg: Dict[str, Any], now: datetime) -> datetime:
+    """now'dan önceki (ya da now'a eşit) en son planlı derleme zamanı."""
+    d = cfg.get("daemon", {})
+    days_back = (now.weekday() - int(d.get("emit_weekday", 6))) % 7
+    slot = (now - timedelta(days=days_back)).replace(hour=int(d.get("emit_hour_utc", 7)), minute=0,
+                                                     second=0, microsecond=0)
+    return slot - timedelta(weeks=1) if slot > now else slot
+
+def emit_due(cfg: Dict[str, Any], store: Dict[str, Any], now: datetime) -> bool:
+    """
+    Son planlı zamandan bu yana derleme üretilmediyse True. Daemon o gün hiç çalışmamış
+    olsa da kaçırılan derleme ilk turda üretilir; hafta sessizce atlanmaz.
+    """
+    last = store.get("last_emit")
+    return not last or last < last_emit_slot(cfg, now).strftime("%Y-%m-%d")
+
+def emit_digest(cfg: Dict[str, Any], store: Dict[str, Any], state: Dict[str, Any], now: datetime) -> None:
+    """Haftalık derlemeyi staging deposundan üretir (ağ isteği yok)."""
+    today = now.strftime("%Y-%m-%d")
+    ts = safe_ts()
+    state["last_run_utc"] = now_utc_iso()
+
+    series = cfg.get("series", [])
+    jobs = []
+    for s in series:
+        staged = _load_json(_staging_path(s.get("key", "series")), {"items": []})
+        job = make_series_job(s, staged["items"], state, today, ts)
+        if job:
+            jobs.append(job)
+
+    trends_dir = os.path.join("out", "_trends")
+    trends = attach_trends(jobs, today, trends_dir)
+
+    series_reports = render_all(jobs, cfg.get("workers"))
+    write_reports(series_reports)
+    publish_wordpress(cfg, series_reports)
+    save_state(state)
+    save_trends(trends, trends_dir)
+
+    # State kaydedildikten sonra boşalt: arada kesilirse kayıtlar zaten "görülmüş" sayılır.
+    for s in series:
+        path = _staging_path(s.get("key", "series"))
+        if os.path.exists(path):
+            os.remove(path)
+    store["last_emit"] = today
+
+    deliver_email(today, series_reports)
+
+
+def run_daemon(cfg: Dict[str, Any], once: bool = False) -> None:
+    tick = int(cfg.get("daemon", {}).get("tick_seconds", 300))
+    store = _load_json(DAEMON_FILE, {"last_poll": {}, "last_emit": None, "validators": {}})
+
+    while True:
+        now = datetime.now(timezone.utc)
+        try:
+            state = load_state()
+
+            with conditional_requests(store["validators"]):
+                poll_sources(cfg, store, state, now)
+            _save_json(DAEMON_FILE, store)
+
+            if emit_due(cfg, store, now):
+                emit_digest(cfg, store, state, now)
+                _save_json(DAEMON_FILE, store)
+        except Exception as e:
+            # Tek bir turdaki render/disk hatası uzun süre çalışan süreci durdurmasın;
+            # staging ve state diskte kaldığı için bir sonraki tur kaldığı yerden dener.
+            print(f"[DAEMON] Tur başarısız ({type(e).__name__}):", e)
+
+        if once:
+            return
+        try:
+            time.sleep(tick)
+        except KeyboardInterrupt:
+            print("[DAEMON] Durduruldu.")
+            return
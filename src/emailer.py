@@ -5,12 +5,12 @@ from email.mime.text import MIMEText
 from email.utils import formatdate
 
 
-def send_email(subject: str, body_text: str):
+def send_email(subject: str, body_text: str, to_override: str = None):
     host = (os.environ.get("SMTP_HOST") or "").strip()
     port_str = (os.environ.get("SMTP_PORT") or "").strip()
     user = (os.environ.get("SMTP_USER") or "").strip()
     pwd = (os.environ.get("SMTP_PASS") or "").strip()
-    to_raw = (os.environ.get("MAIL_TO") or "").strip()
+    to_raw = (to_override or os.environ.get("MAIL_TO") or "").strip()
 
     if not host:
         raise ValueError("SMTP_HOST boş. GitHub Secrets/Vars kontrol et.")
@@ -1,25 +1,18 @@
+import argparse
 import json
 import os
-from datetime import datetime, timezone
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from datetime import date, datetime, timezone
 from typing import List, Dict, Any
 
-from .sources_google_news import fetch_google_news_items
-from .sources_pubmed import fetch_pubmed_items
-from .summarize_tr import summarize_tr
-from .state_store import load_state, save_state, filter_new
+from .source_registry import enabled_sources, fetch_source
+from .summarize_tr import summarize_tr_batch, corpus_idf
+from .trends import load_trends, save_trends, update_trends, series_trend, trend_lines, iso_week
+from .state_store import STATE_FILE, load_state, save_state, filter_new, merge_seen
 from .emailer import send_email
-from .utils import now_utc_iso, clean_text
-
-# Optional sources (now expected to exist if you added files)
-try:
-    from .sources_medrxiv import fetch_medrxiv_items
-except Exception:
-    fetch_medrxiv_items = None
-
-try:
-    from .sources_cochrane import fetch_cochrane_items
-except Exception:
-    fetch_cochrane_items = None
+from .utils import now_utc_iso, clean_text, stable_id
 
 
 def safe_ts() -> str:
@@ -113,7 +106,22 @@ def translate_title_tr(title: str) -> str:
     return t[:1].upper() + t[1:]
 
 
-def build_series_markdown(series_title: str, items: List[Dict[str, Any]]) -> str:
+def summarize_series(items: List[Dict[str, Any]], idf: Dict[str, float] = None) -> Dict[str, str]:
+    """
+    Serinin Markdown'da gösterilecek kayıtlarını tek geçişte özetler. URL → özet.
+    idf: çalıştırmanın ortak tablosu (corpus_idf); verilmezse bu kayıtlardan hesaplanır.
+    """
+    reviews   = [i for i in items if i.get("kind") == "review"][:10]
+    papers    = [i for i in items if i.get("kind") == "paper"][:10]
+    preprints = [i for i in items if i.get("kind") == "preprint"][:10]
+    news      = [i for i in items if i.get("kind") == "news"][:15]
+
+    shown = reviews + papers + preprints + news
+    limits = [2] * len(reviews) + [1] * len(papers + preprints) + [2] * len(news)
+    return dict(zip([it.get("url", "") for it in shown], summarize_tr_batch(shown, max_sentences=limits, idf=idf)))
+
+def build_series_markdown(series_title: str, items: List[Dict[str, Any]], trend: Dict[str, Any] = None,
+                          summaries: Dict[str, str] = None) -> str:
     lines = []
     lines.append(f"# {series_title}\n")
     lines.append("> Bu içerik otomatik derlenmiştir. Tıbbi öneri yerine geçmez; kişisel durumunuz için uzmana danışınız.\n")
@@ -123,10 +131,13 @@ def build_series_markdown(series_title: str, items: List[Dict[str, Any]]) -> str
     preprints = [i for i in items if i.get("kind") == "preprint"]
     news      = [i for i in items if i.get("kind") == "news"]
 
+    if summaries is None:
+        summaries = summarize_series(items)
+
     if reviews:
         lines.append("## 📚 Sistematik Derlemeler (Cochrane)\n")
         for it in reviews[:10]:
-            tr_sum = summarize_tr(it.get("title",""), it.get("snippet",""), max_sentences=2)
+            tr_sum = summaries[it.get("url", "")]
             lines.append(f"### {it.get('title','')}")
             lines.append(f"- **Türkçe özet:** {tr_sum}")
             lines.append(f"- **Kaynak:** {it.get('url','')}\n")
@@ -134,7 +145,7 @@ def build_series_markdown(series_title: str, items: List[Dict[str, Any]]) -> str
     if papers:
         lines.append("## 🔬 Hakemli Makaleler (PubMed)\n")
         for it in papers[:10]:
-            tr_sum = summarize_tr(it.get("title",""), it.get("snippet",""), max_sentences=1)
+            tr_sum = summaries[it.get("url", "")]
             lines.append(f"### {it.get('title','')}")
             lines.append(f"- **Türkçe özet:** {tr_sum}")
             lines.append(f"- **Kaynak:** {it.get('url','')}\n")
@@ -142,7 +153,7 @@ def build_series_markdown(series_title: str, items: List[Dict[str, Any]]) -> str
     if preprints:
         lines.append("## 🧪 Ön Baskılar (medRxiv) — Hakem Değerlendirmesi Olmayabilir\n")
         for it in preprints[:10]:
-            tr_sum = summarize_tr(it.get("title",""), it.get("snippet",""), max_sentences=1)
+            tr_sum = summaries[it.get("url", "")]
             lines.append(f"### {it.get('title','')}")
             lines.append(f"- **Türkçe özet:** {tr_sum}")
             lines.append(f"- **Kaynak:** {it.get('url','')}\n")
@@ -150,16 +161,88 @@ def build_series_markdown(series_title: str, items: List[Dict[str, Any]]) -> str
     if news:
         lines.append("## 🗞️ Haberler & Yazılar (Google News)\n")
         for it in news[:15]:
-            tr_sum = summarize_tr(it.get("title",""), it.get("snippet",""), max_sentences=2)
+            tr_sum = summaries[it.get("url", "")]
             lines.append(f"### {it.get('title','')}")
             lines.append(f"- **Özet:** {tr_sum}")
             lines.append(f"- **Kaynak:** {it.get('url','')}\n")
 
+    comparison = trend_lines(trend) if trend else []
+    if comparison:
+        lines.append("## 📈 Önceki Haftalarla Karşılaştırma\n")
+        for t in comparison:
+            lines.append(f"- {t}")
+        lines.append("")
+
     lines.append("---")
     lines.append(f"_Üretim zamanı (UTC): {now_utc_iso()}_")
     return "\n".join(lines)
 
 
+def build_email_series_section(r: Dict[str, Any], summaries: Dict[str, str] = None,
+                               idf: Dict[str, float] = None) -> List[str]:
+    lines = []
+    lines.append("=" * 72)
+    lines.append(r["series_title"].upper())
+    lines.append("=" * 72)
+    lines.append(f"Yeni kaynak sayısı: {r['new_count']}")
+    c = r.get("counts", {})
+    lines.append(f"Dağılım: Cochrane={c.get('review',0)} | PubMed={c.get('paper',0)} | medRxiv={c.get('preprint',0)} | Haber={c.get('news',0)}")
+    lines.append(f"GitHub dosyası: {r['file_path']}")
+    comparison = trend_lines(r["trend"]) if r.get("trend") else []
+    if comparison:
+        lines.append("Önceki haftalarla karşılaştırma:")
+        for t in comparison:
+            lines.append(f"  • {t}")
+    lines.append("")
+
+    buckets = r.get("buckets", {})
+    if idf is None:
+        idf = corpus_idf([it for b in buckets.values() for it in b])
+    if summaries is None:
+        summaries = summarize_series([it for b in buckets.values() for it in b], idf)
+    # E-postada makale/ön baskı özetleri 2 cümledir (Markdown'da 1). Aynı IDF tablosuyla
+    # puanlandığı için ilk cümle Markdown'dakiyle aynıdır; diğer türler olduğu gibi kullanılır.
+    longer = buckets.get("paper", [])[:3] + buckets.get("preprint", [])[:2]
+    summaries = {**summaries, **dict(zip([it.get("url", "") for it in longer],
+                                         summarize_tr_batch(longer, max_sentences=2, idf=idf)))}
+
+    def emit_section(title_tr, kind_key, max_n=3, extra_note=None):
+        items = buckets.get(kind_key, [])
+        if not items:
+            return
+        lines.append(title_tr)
+        lines.append("-" * 72)
+        if extra_note:
+            lines.append(extra_note)
+        for it in items[:max_n]:
+            orig_title = clean_text(it.get("title",""))
+            url = clean_text(it.get("url",""))
+            snippet = clean_text(it.get("snippet",""))
+
+            if kind_key in ("paper", "review", "preprint") or is_likely_english(orig_title):
+                tr_title = translate_title_tr(orig_title)
+                tr_sum = summaries[it.get("url", "")]
+                lines.append(f"Orijinal Başlık: {orig_title}")
+                lines.append(f"Türkçe Başlık : {tr_title}")
+                lines.append(f"Türkçe Özet   : {tr_sum}")
+            else:
+                tr_sum = summaries[it.get("url", "")]
+                lines.append(f"Başlık: {orig_title}")
+                lines.append(f"Özet  : {tr_sum}")
+
+            if url:
+                lines.append(f"Bağlantı: {url}")
+            lines.append("")
+        lines.append("")
+
+    emit_section("A) COCHRANE – Sistematik Derlemeler", "review", max_n=2)
+    emit_section("B) PUBMED – Hakemli Makaleler", "paper", max_n=3)
+    emit_section("C) MEDRXIV – Ön Baskılar (Hakem Değerlendirmesi Olmayabilir)", "preprint", max_n=2,
+                 extra_note="Uyarı: Ön baskılar klinik uygulamayı yönlendirmek için tek başına kullanılmamalıdır.")
+    emit_section("D) HABER / BLOG – Gündem", "news", max_n=3)
+    return lines
+
+
 def build_turkish_email(today: str, series_reports: List[Dict[str, Any]]) -> str:
     lines = []
     lines.append(f"ARTHERA CLINIC – FİZYOTERAPİ GÜNDEM ÖZETİ ({today})")
@@ -196,135 +279,327 @@ def build_turkish_email(today: str, series_reports: List[Dict[str, Any]]) -> str
     lines.append("")
 
     for r in series_reports:
-        lines.append("=" * 72)
-        lines.append(r["series_title"].upper())
-        lines.append("=" * 72)
-        lines.append(f"Yeni kaynak sayısı: {r['new_count']}")
-        c = r.get("counts", {})
-        lines.append(f"Dağılım: Cochrane={c.get('review',0)} | PubMed={c.get('paper',0)} | medRxiv={c.get('preprint',0)} | Haber={c.get('news',0)}")
-        lines.append(f"GitHub dosyası: {r['file_path']}")
-        lines.append("")
+        # render_series bölümü süreç havuzunda önceden üretmiş olabilir.
+        lines.extend(r.get("email_section") or build_email_series_section(r))
 
-        buckets = r.get("buckets", {})
-
-        def emit_section(title_tr, kind_key, max_n=3, extra_note=None):
-            items = buckets.get(kind_key, [])
-            if not items:
-                return
-            lines.append(title_tr)
-            lines.append("-" * 72)
-            if extra_note:
-                lines.append(extra_note)
-            for it in items[:max_n]:
-                orig_title = clean_text(it.get("title",""))
-                url = clean_text(it.get("url",""))
-                snippet = clean_text(it.get("snippet",""))
-
-                if kind_key in ("paper", "review", "preprint") or is_likely_english(orig_title):
-                    tr_title = translate_title_tr(orig_title)
-                    tr_sum = summarize_tr(orig_title, snippet, max_sentences=2)
-                    lines.append(f"Orijinal Başlık: {orig_title}")
-                    lines.append(f"Türkçe Başlık : {tr_title}")
-                    lines.append(f"Türkçe Özet   : {tr_sum}")
-                else:
-                    tr_sum = summarize_tr(orig_title, snippet, max_sentences=2)
-                    lines.append(f"Başlık: {orig_title}")
-                    lines.append(f"Özet  : {tr_sum}")
-
-                if url:
-                    lines.append(f"Bağlantı: {url}")
-                lines.append("")
-            lines.append("")
+    return "\n".join(lines)
 
-        emit_section("A) COCHRANE – Sistematik Derlemeler", "review", max_n=2)
-        emit_section("B) PUBMED – Hakemli Makaleler", "paper", max_n=3)
-        emit_section("C) MEDRXIV – Ön Baskılar (Hakem Değerlendirmesi Olmayabilir)", "preprint", max_n=2,
-                     extra_note="Uyarı: Ön baskılar klinik uygulamayı yönlendirmek için tek başına kullanılmamalıdır.")
-        emit_section("D) HABER / BLOG – Gündem", "news", max_n=3)
 
-    return "\n".join(lines)
+def render_series(job: Dict[str, Any], idf: Dict[str, float] = None) -> Dict[str, Any]:
+    """
+    Bir serinin CPU ağırlıklı işi: gruplama, özetleme, Markdown ve e-posta bölümü.
+    Süreç havuzunda çalışır; yalnızca job içindeki verilere ve ortak IDF tablosuna bakar, dosya yazmaz.
+    """
+    fresh = job["items"]
+    buckets = {
+        "review":   [i for i in fresh if i.get("kind") == "review"],
+        "paper":    [i for i in fresh if i.get("kind") == "paper"],
+        "preprint": [i for i in fresh if i.get("kind") == "preprint"],
+        "news":     [i for i in fresh if i.get("kind") == "news"],
+    }
+    report = {
+        "series_key": job["series_key"],
+        "series_title": job["series_title"],
+        "date": job["date"],
+        "new_count": len(fresh),
+        "counts": count_by_kind(fresh),
+        "file_path": job["file_path"],
+        "buckets": buckets,
+        "trend": job.get("trend")
+    }
+    # Özetler bir kez hesaplanır; Markdown ve e-posta aynı metni kullanır.
+    summaries = summarize_series(fresh, idf)
+    report["markdown"] = build_series_markdown(job["series_title"], fresh, job.get("trend"), summaries)
+    report["email_section"] = build_email_series_section(report, summaries, idf)
+    return report
+
+def render_all(jobs: List[Dict[str, Any]], workers: int = None) -> List[Dict[str, Any]]:
+    """
+    Serileri işler; sonuç sırası işçi sayısından bağımsız olarak jobs sırasıdır.
+    Doküman frekansları burada, çalıştırmanın tüm yeni kayıtları üzerinden bir kez hesaplanır.
+    workers: config.json "workers". Verilmezse seri çalışır: birkaç seri/yüzlerce kayıtta
+    süreç havuzunun açılış maliyeti render süresinden fazladır; havuz yalnızca açıkça istenince kurulur.
+    """
+    workers = int(workers or 1)
+    render = partial(render_series, idf=corpus_idf([it for j in jobs for it in j["items"]]))
+    if workers <= 1 or len(jobs) <= 1:
+        return [render(j) for j in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(render, jobs))
+
+
+def select_series(series: List[Dict[str, Any]], keys: List[str] = None, shard: str = None) -> List[Dict[str, Any]]:
+    """
+    keys: yalnızca bu anahtarlara sahip seriler.
+    shard: "i/n" → seri anahtarının hash'ine göre n parçadan i'incisi (0 tabanlı).
+    """
+    out = [s for s in series if not keys or s.get("key", "series") in keys]
+    if shard:
+        i, n = (int(x) for x in shard.split("/"))
+        out = [s for s in out if int(stable_id(s.get("key", "series")), 16) % n == i]
+    return out
+
+def match_global_items(series_cfg: Dict[str, Any], items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Global kaynak kayıtlarından serinin anahtar kelimeleriyle eşleşenler."""
+    kws = series_keywords(series_cfg)
+    return [it for it in items if keyword_match(it, kws)] if (items and kws) else []
+
+def make_series_job(series_cfg: Dict[str, Any], items: List[Dict[str, Any]], state: Dict[str, Any],
+                    today: str, ts: str, out_dir: str = "out") -> Dict[str, Any]:
+    """URL dedup + state filtresi; yeni kayıt yoksa None."""
+    series_key = series_cfg.get("key", "series")
+    series_title = f"{series_cfg.get('title_prefix','Seri')} — Derleme ({today})"
+
+    fresh = filter_new(dedup_by_url(items), state)
+    if not fresh:
+        print(f"[{series_key}] Yeni içerik yok; dosya üretilmedi.")
+        return None
+
+    return {
+        "series_key": series_key,
+        "series_title": series_title,
+        "date": today,
+        "file_path": f"{out_dir}/{series_key}/{today}_{ts}.md",
+        "items": fresh
+    }
+
+def collect_series_jobs(cfg: Dict[str, Any], series: List[Dict[str, Any]], state: Dict[str, Any],
+                        today: str, ts: str, out_dir: str = "out") -> List[Dict[str, Any]]:
+    if not series:
+        return []
+
+    # Global sources (yalnızca config'te tanımlı olanlar; modüller ilk kullanımda yüklenir)
+    global_cfg = cfg.get("global_sources", {})
 
+    global_items = []
+    for spec in enabled_sources(global_cfg, "global"):
+        items = fetch_source(spec, global_cfg[spec.key])
+        print(f"[GLOBAL] {spec.label} çekilen kayıt: {len(items)}")
+        global_items.append(items)
+
+    # Çekme + state: seri sırasıyla (aynı URL yalnızca ilk seride yer alır)
+    jobs = []
+
+    for s in series:
+        items = []
+        for spec in enabled_sources(s, "series"):
+            items += fetch_source(spec, s[spec.key])
+        for g_items in global_items:
+            items += match_global_items(s, g_items)
+
+        job = make_series_job(s, items, state, today, ts, out_dir)
+        if job:
+            jobs.append(job)
+    return jobs
+
+def write_reports(series_reports: List[Dict[str, Any]]) -> None:
+    # markdown raporda kalır: WordPress aşaması ve shard report.json dosyaya değil ona bakar.
+    for r in series_reports:
+        write_text(r["file_path"], r["markdown"])
+        print(f"[{r['series_key']}] Yazıldı: {r['file_path']}")
 
-def main():
-    with open("config.json", "r", encoding="utf-8") as f:
-        cfg = json.load(f)
+def publish_wordpress(cfg: Dict[str, Any], series_reports: List[Dict[str, Any]], out_dir: str = "out") -> None:
+    if not cfg.get("wordpress") or not series_reports:
+        return
+    from .wp_stage import publish_reports  # yalnızca WordPress etkinse yüklenir
+    try:
+        publish_reports(cfg, series_reports, cache_path=os.path.join(out_dir, "_wordpress", "wp_cache.json"))
+    except Exception as e:
+        print("WordPress publish failed, continuing without stopping workflow:", e)
 
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    ts = safe_ts()
+def deliver_email(today: str, series_reports: List[Dict[str, Any]], out_dir: str = "out", mail_to: str = None) -> None:
+    subject = f"ArtheraClinic – Fizyoterapi Gündem Özeti ({today})"
+    mail_text = build_turkish_email(today, series_reports)
 
-    state = load_state()
-    state["last_run_utc"] = now_utc_iso()
+    summary_path = f"{out_dir}/email_summary/{today}_{safe_ts()}.txt"
+    write_text(summary_path, mail_text)
+    print("Email summary written:", summary_path)
 
-    # Global sources
-    global_cfg = cfg.get("global_sources", {})
+    try:
+        send_email(subject, mail_text, to_override=mail_to)
+        print("Email sent.")
+    except Exception as e:
+        print("Email failed, continuing without stopping workflow:", e)
 
-    med_items = []
-    if fetch_medrxiv_items and global_cfg.get("medrxiv"):
-        med_items = fetch_medrxiv_items(global_cfg.get("medrxiv", {}))
-    print(f"[GLOBAL] medRxiv çekilen kayıt: {len(med_items)}")
 
-    coch_items = []
-    if fetch_cochrane_items and global_cfg.get("cochrane"):
-        coch_items = fetch_cochrane_items(global_cfg.get("cochrane", {}))
-    print(f"[GLOBAL] Cochrane çekilen kayıt: {len(coch_items)}")
+def attach_trends(jobs: List[Dict[str, Any]], today: str, trends_dir: str) -> Dict[str, Any]:
+    """
+    Yeni kayıtları trend deposuna ekler (bellekte) ve her işe önceki haftalarla
+    karşılaştırmayı koyar. Kalıcı yazmak çağıranın işidir (save_trends).
+    """
+    store = load_trends(trends_dir)
+    week = iso_week(date.fromisoformat(today))
+    update_trends(store, [(j["series_key"], j["items"]) for j in jobs], week)
+    for j in jobs:
+        j["trend"] = series_trend(store, j["series_key"], week)
+    return store
+
+def run(cfg: Dict[str, Any], series: List[Dict[str, Any]], state_file: str = STATE_FILE,
+        out_dir: str = "out", mail_to: str = None) -> None:
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    ts = safe_ts()
 
-    series_reports = []
+    state = load_state(state_file)
+    state["last_run_utc"] = now_utc_iso()
 
-    for s in cfg.get("series", []):
-        series_key = s.get("key", "series")
-        series_title = f"{s.get('title_prefix','Seri')} — Derleme ({today})"
+    jobs = collect_series_jobs(cfg, series, state, today, ts, out_dir=out_dir)
+    trends_dir = os.path.join(out_dir, "_trends")
+    trends = attach_trends(jobs, today, trends_dir)
 
-        g_items = fetch_google_news_items(s.get("google_news", {}))
-        p_items = fetch_pubmed_items(s.get("pubmed", {}))
+    # Özetleme + render (config'te "workers" verilirse seriler arası paralel)
+    series_reports = render_all(jobs, cfg.get("workers"))
+    write_reports(series_reports)
+    publish_wordpress(cfg, series_reports, out_dir=out_dir)
 
-        kws = series_keywords(s)
+    save_state(state, state_file)
+    save_trends(trends, trends_dir)
 
-        med_for_series = [it for it in med_items if keyword_match(it, kws)] if (med_items and kws) else []
-        coch_for_series = [it for it in coch_items if keyword_match(it, kws)] if (coch_items and kws) else []
+    deliver_email(today, series_reports, out_dir=out_dir, mail_to=mail_to)
 
-        combined = dedup_by_url(g_items + p_items + med_for_series + coch_for_series)
-        fresh = filter_new(combined, state)
+def run_shard(cfg: Dict[str, Any], series: List[Dict[str, Any]], shard_dir: str, run_id: str) -> None:
+    """
+    Serilerin bir alt kümesini çalıştırır. state.json'a yazmaz ve e-posta göndermez;
+    bunun yerine shard_dir altına state delta'sı ve rapor bırakır (bkz. merge_shards).
+    run_id her iki dosyaya yazılır; merge yalnızca aynı run_id'li shard'ları birleştirir.
+    """
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    ts = safe_ts()
+    run_utc = now_utc_iso()
 
-        if not fresh:
-            print(f"[{series_key}] Yeni içerik yok; dosya üretilmedi.")
+    state = load_state()
+    jobs = collect_series_jobs(cfg, series, state, today, ts)
+    # Karşılaştırma bu shard'ın sayılarıyla hesaplanır; depoya merge_shards yazar.
+    attach_trends(jobs, today, os.path.join("out", "_trends"))
+
+    series_reports = render_all(jobs, cfg.get("workers"))
+    write_reports(series_reports)
+
+    delta = {"run_id": run_id, "seen": [[it["url"], run_utc] for j in jobs for it in j["items"]]}
+    # Delta en son yazılır: merge_shards onu shard'ın tamamlandığı işareti sayar.
+    write_text(os.path.join(shard_dir, "report.json"),
+               json.dumps({"run_id": run_id, "today": today, "series_reports": series_reports}, ensure_ascii=False, indent=2))
+    write_text(os.path.join(shard_dir, "state_delta.json"), json.dumps(delta, ensure_ascii=False, indent=2))
+    print(f"[SHARD] {len(series)} seri, {len(delta['seen'])} yeni URL: {shard_dir}")
+
+def merge_shards(cfg: Dict[str, Any], shards_root: str, run_id: str) -> None:
+    """
+    run_id'ye ait shard delta'larını state.json'a birleştirir ve tek bir ortak e-posta üretir.
+    Her shard state["merged_shards"] ve trend deposunun "applied_shards" listesine ayrı ayrı
+    işlenir; ikisine de işlenen shard klasörü silinir. Aynı komut ikinci kez çalışırsa
+    hiçbir şey yapmaz; yarıda kesilmişse yalnızca eksik kalan adım tamamlanır.
+    """
+    state = load_state()
+    merged = state.setdefault("merged_shards", [])
+    trends_dir = os.path.join("out", "_trends")
+    trends = load_trends(trends_dir)
+    applied = trends["header"].setdefault("applied_shards", [])
+
+    shards = []
+    for name in sorted(os.listdir(shards_root)) if os.path.isdir(shards_root) else []:
+        shard_dir = os.path.join(shards_root, name)
+        delta_path = os.path.join(shard_dir, "state_delta.json")
+        report_path = os.path.join(shard_dir, "report.json")
+        if not (os.path.isfile(delta_path) and os.path.isfile(report_path)):
+            print(f"[MERGE] {name} tamamlanmamış (delta/rapor eksik); atlandı.")
             continue
+        with open(delta_path, "r", encoding="utf-8") as f:
+            delta = json.load(f)
+        if delta.get("run_id") != run_id:
+            print(f"[MERGE] {name} başka bir çalıştırmaya ait ({delta.get('run_id')}); atlandı.")
+            continue
+        shard_id = f"{run_id}/{name}"
+        if shard_id in merged and shard_id in applied:
+            print(f"[MERGE] {name} zaten birleştirilmiş; klasörü siliniyor.")
+            shutil.rmtree(shard_dir, ignore_errors=True)
+            continue
+        with open(report_path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+        shards.append((name, shard_id, delta, report))
+
+    if not shards:
+        print(f"Birleştirilecek shard bulunamadı ({run_id}):", shards_root)
+        return
+
+    # Rapor sırası config.json'daki seri sırası olsun
+    order = {s.get("key", "series"): i for i, s in enumerate(cfg.get("series", []))}
+    def sorted_reports(selected):
+        reports = [r for _, _, _, report in selected for r in report["series_reports"]]
+        return sorted(reports, key=lambda r: (order.get(r["series_key"], len(order)), r["series_key"]))
+
+    new_state = [sh for sh in shards if sh[1] not in merged]
+    new_trends = [sh for sh in shards if sh[1] not in applied]
+    # E-posta ve WordPress yalnızca state'e ilk kez işlenen shard'lar için
+    series_reports = sorted_reports(new_state)
+
+    if new_state:
+        state["last_run_utc"] = now_utc_iso()
+        merge_seen(state, [delta for _, _, delta, _ in new_state])
+        merged.extend(shard_id for _, shard_id, _, _ in new_state)
+        state["merged_shards"] = merged[-500:]
+        save_state(state)
+
+    if new_trends:
+        week = iso_week(date.fromisoformat(max(report["today"] for _, _, _, report in new_trends)))
+        update_trends(trends, [(r["series_key"], [it for b in r["buckets"].values() for it in b])
+                               for r in sorted_reports(new_trends)], week)
+        applied.extend(shard_id for _, shard_id, _, _ in new_trends)
+        trends["header"]["applied_shards"] = applied[-500:]
+        save_trends(trends, trends_dir)
+
+    # İki kayıt da yazıldıktan sonra sil: arada kesilirse listeler tekrar uygulamayı engeller.
+    for name, _, _, _ in shards:
+        shutil.rmtree(os.path.join(shards_root, name), ignore_errors=True)
+    print(f"[MERGE] {len(shards)} shard birleştirildi ({run_id}).")
+
+    if not new_state:
+        return
+    publish_wordpress(cfg, series_reports)
+
+    deliver_email(max(report["today"] for _, _, _, report in new_state), series_reports)
+
+
+def shard_arg(value: str) -> str:
+    """argparse tipi: "i/n", 0 <= i < n."""
+    try:
+        i, n = (int(x) for x in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"i/n biçiminde iki tam sayı bekleniyor: {value}")
+    if not 0 <= i < n:
+        raise argparse.ArgumentTypeError(f"0 <= i < n olmalı: {value}")
+    return f"{i}/{n}"
+
+def main(argv: List[str] = None):
+    ap = argparse.ArgumentParser(description="Arthera seri derleyici")
+    ap.add_argument("--series", action="append", default=[], help="Yalnızca bu seri anahtarı (tekrarlanabilir)")
+    ap.add_argument("--shard", type=shard_arg, help="Hash shard'ı, 0 tabanlı: i/n (ör. 0/4)")
+    ap.add_argument("--shard-dir", default="shards", help="Shard çıktılarının kök klasörü")
+    ap.add_argument("--merge-shards", action="store_true", help="--shard-dir altındaki delta'ları birleştir ve e-postayı gönder")
+    ap.add_argument("--run-id", help="Shard'ları ve merge'ü eşleyen çalıştırma kimliği (varsayılan: bugünün UTC tarihi; CI'da ör. $GITHUB_RUN_ID)")
+    ap.add_argument("--daemon", action="store_true", help="Sürekli çalış: kaynakları aralıklarla yokla, haftalık derlemeyi üret")
+    ap.add_argument("--once", action="store_true", help="--daemon ile: tek bir yoklama turu yap ve çık")
+    args = ap.parse_args(argv)
 
-        md = build_series_markdown(series_title, fresh)
-        file_path = f"out/{series_key}/{today}_{ts}.md"
-        write_text(file_path, md)
-        print(f"[{series_key}] Yazıldı: {file_path}")
-
-        buckets = {
-            "review":   [i for i in fresh if i.get("kind") == "review"],
-            "paper":    [i for i in fresh if i.get("kind") == "paper"],
-            "preprint": [i for i in fresh if i.get("kind") == "preprint"],
-            "news":     [i for i in fresh if i.get("kind") == "news"],
-        }
-        counts = count_by_kind(fresh)
-
-        series_reports.append({
-            "series_key": series_key,
-            "series_title": series_title,
-            "new_count": len(fresh),
-            "counts": counts,
-            "file_path": file_path,
-            "buckets": buckets
-        })
-
-    save_state(state)
+    with open("config.json", "r", encoding="utf-8") as f:
+        cfg = json.load(f)
 
-    subject = f"ArtheraClinic – Fizyoterapi Gündem Özeti ({today})"
-    mail_text = build_turkish_email(today, series_reports)
+    if args.daemon:
+        from .daemon import run_daemon
+        run_daemon(cfg, once=args.once)
+        return
 
-    summary_path = f"out/email_summary/{today}_{safe_ts()}.txt"
-    write_text(summary_path, mail_text)
-    print("Email summary written:", summary_path)
+    run_id = args.run_id or datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-    try:
-        send_email(subject, mail_text)
-        print("Email sent.")
-    except Exception as e:
-        print("Email failed, continuing without stopping workflow:", e)
+    if args.merge_shards:
+        merge_shards(cfg, args.shard_dir, run_id)
+        return
+
+    series = select_series(cfg.get("series", []), args.series, args.shard)
+    if args.series or args.shard:
+        name = f"shard-{args.shard.replace('/', 'of')}" if args.shard else "keys-" + "-".join(sorted(args.series))
+        run_shard(cfg, series, os.path.join(args.shard_dir, name), run_id)
+        return
+
+    run(cfg, series)
 
 
 if __name__ == "__main__":
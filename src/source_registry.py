@@ -0,0 +1,67 @@
+"""
+Kaynak kayıt defteri.
+
+Her kaynak burada tek satırla tanımlanır; modülü yalnızca config.json onu
+etkinleştirdiğinde (ilk kullanımda) import edilir.
+
+Kaynak modülü sözleşmesi:
+    plan_requests(cfg, window=None) -> [{"url", "params"?, "headers"?, "source", ...}]
+    parse_response(req, response)   -> [kayıt, ...]
+    SKIP_FAILED_REQUESTS = True      # isteğe bağlı: bozuk istek diğerlerini durdurmasın
+Çok adımlı kaynaklar (ör. PubMed: esearch → esummary) bunun yerine
+SourceSpec.fetch ile fetch(cfg, window=None) fonksiyonu bildirir.
+
+Yeni bir kaynak (ör. PEDro, Europe PMC) için: src/sources_<ad>.py + SOURCES'a bir satır,
+ya da çalışma anında register_source(...).
+"""
+import importlib
+from typing import List, Dict, Any, NamedTuple, Optional
+
+from .utils import run_plan
+
+
+class SourceSpec(NamedTuple):
+    key: str                     # config anahtarı (global_sources.<key> ya da series[].<key>)
+    label: str                   # log'larda görünen ad
+    scope: str                   # "global" ya da "series"
+    module: str                  # lazy import edilecek modül (src paketine göre)
+    windowed: bool = False       # tarih aralığı (backfill) destekler mi
+    fetch: Optional[str] = None  # plan/parse yerine kullanılacak fetch fonksiyonu
+
+
+# Sıra önemlidir: seri kayıtları bu sırayla birleştirilir.
+SOURCES: List[SourceSpec] = [
+    SourceSpec("google_news", "Google News", "series", ".sources_google_news", windowed=True),
+    SourceSpec("pubmed", "PubMed", "series", ".sources_pubmed", windowed=True, fetch="fetch_pubmed_items"),
+    SourceSpec("medrxiv", "medRxiv", "global", ".sources_medrxiv"),
+    SourceSpec("cochrane", "Cochrane", "global", ".sources_cochrane"),
+]
+
+_loaded = {}
+
+
+def register_source(spec: SourceSpec) -> None:
+    """Aynı anahtarlı kaynağı değiştirir, yoksa sona ekler."""
+    for i, s in enumerate(SOURCES):
+        if s.key == spec.key and s.scope == spec.scope:
+            SOURCES[i] = spec
+            return
+    SOURCES.append(spec)
+
+def enabled_sources(section: Dict[str, Any], scope: str) -> List[SourceSpec]:
+    """section (global_sources ya da bir seri config'i) içinde tanımlı olan kaynaklar."""
+    return [s for s in SOURCES if s.scope == scope and section.get(s.key)]
+
+def load_source(spec: SourceSpec):
+    mod = _loaded.get(spec.module)
+    if mod is None:
+        mod = importlib.import_module(spec.module, __package__)
+        _loaded[spec.module] = mod
+    return mod
+
+def fetch_source(spec: SourceSpec, source_cfg: Dict[str, Any], window=None) -> List[Dict[str, Any]]:
+    mod = load_source(spec)
+    if spec.fetch:
+        return getattr(mod, spec.fetch)(source_cfg, window=window)
+    return run_plan(mod.plan_requests(source_cfg, window), mod.parse_response,
+                    skip_failed=getattr(mod, "SKIP_FAILED_REQUESTS", False))
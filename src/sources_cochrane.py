@@ -1,27 +1,20 @@
 # src/sources_cochrane.py
 import xml.etree.ElementTree as ET
-import requests
 from .utils import clean_text, stable_id
 
-def fetch_cochrane_items(cfg):
-    feeds = cfg.get("feeds", [])
-    limit = int(cfg.get("max_items_per_feed", 30))
-    items = []
+HEADERS = {"User-Agent": "ArtheraSeriesBot/1.0"}
 
-    for url in feeds:
-        try:
-            items.extend(_parse_rss(url, source="Cochrane", limit=limit))
-        except Exception as e:
-            print("Cochrane feed parse failed:", url, e)
+SKIP_FAILED_REQUESTS = True
 
-    dedup = {it["url"]: it for it in items if it.get("url")}
-    return list(dedup.values())
+def plan_requests(cfg, window=None):
+    limit = int(cfg.get("max_items_per_feed", 30))
+    return [{"url": url, "headers": HEADERS, "source": "Cochrane", "limit": limit} for url in cfg.get("feeds", [])]
 
-def _parse_rss(url, source="Cochrane", limit=30):
-    r = requests.get(url, timeout=30, headers={"User-Agent": "ArtheraSeriesBot/1.0"})
-    r.raise_for_status()
+def parse_response(req, r):
+    return _parse_rss(r.text, source=req["source"], limit=req["limit"])
 
-    root = ET.fromstring(r.text)
+def _parse_rss(text, source="Cochrane", limit=30):
+    root = ET.fromstring(text)
 
     channel = root.find(".//channel")
     if channel is None:
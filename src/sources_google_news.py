@@ -1,39 +1,50 @@
 
 import xml.etree.ElementTree as ET
-import requests
+from datetime import date, timedelta
 from urllib.parse import quote_plus
 from .utils import clean_text, stable_id
 
 BASE = "https://news.google.com/rss/search"
+HEADERS = {"User-Agent": "ArtheraDigestBot/2.0"}
 
-def fetch_google_news_items(cfg):
+def _date_filter(days, window=None):
+    """
+    window yoksa son `days` gün (when:Nd).
+    window=(başlangıç, bitiş) ise [başlangıç, bitiş) aralığı; after: ve before: uçları hariç tutar.
+    """
+    if not window:
+        return f"when:{days}d"
+    start, end = window
+    after = date.fromisoformat(start) - timedelta(days=1)
+    return f"after:{after.isoformat()} before:{end}"
+
+def plan_requests(cfg, window=None):
     hl, gl, ceid = cfg["hl"], cfg["gl"], cfg["ceid"]
     days = int(cfg.get("days", 7))
+    when = _date_filter(days, window)
     max_items = int(cfg.get("max_items", 25))
     queries = list(cfg.get("queries", []))
     site_filters = list(cfg.get("site_filters", []))
 
-    all_items = []
+    reqs = []
 
     for q in queries:
-        rss_url = f"{BASE}?q={quote_plus(q + f' when:{days}d')}&hl={hl}&gl={gl}&ceid={ceid}"
-        all_items.extend(_parse_rss(rss_url, source="Google News", limit=max_items))
+        rss_url = f"{BASE}?q={quote_plus(f'{q} {when}')}&hl={hl}&gl={gl}&ceid={ceid}"
+        reqs.append({"url": rss_url, "headers": HEADERS, "source": "Google News", "limit": max_items})
 
     for domain in site_filters:
         for q in queries[:3]:
-            qq = f"site:{domain} {q} when:{days}d"
+            qq = f"site:{domain} {q} {when}"
             rss_url = f"{BASE}?q={quote_plus(qq)}&hl={hl}&gl={gl}&ceid={ceid}"
-            all_items.extend(_parse_rss(rss_url, source=f"Google News (site:{domain})", limit=max_items//2))
+            reqs.append({"url": rss_url, "headers": HEADERS, "source": f"Google News (site:{domain})", "limit": max_items//2})
+
+    return reqs
 
-    dedup = {}
-    for it in all_items:
-        dedup[it["url"]] = it
-    return list(dedup.values())
+def parse_response(req, r):
+    return _parse_rss(r.text, source=req["source"], limit=req["limit"])
 
-def _parse_rss(url, source, limit=20):
-    r = requests.get(url, timeout=30, headers={"User-Agent": "ArtheraDigestBot/2.0"})
-    r.raise_for_status()
-    root = ET.fromstring(r.text)
+def _parse_rss(text, source, limit=20):
+    root = ET.fromstring(text)
     channel = root.find("channel")
     if channel is None:
         return []
@@ -1,29 +1,21 @@
 # src/sources_medrxiv.py
 import xml.etree.ElementTree as ET
-import requests
 from .utils import clean_text, stable_id
 
-def fetch_medrxiv_items(cfg):
-    feeds = cfg.get("feeds", [])
-    limit = int(cfg.get("max_items_per_feed", 30))
-    items = []
+HEADERS = {"User-Agent": "ArtheraSeriesBot/1.0"}
 
-    for url in feeds:
-        try:
-            items.extend(_parse_atom(url, source="medRxiv", limit=limit))
-        except Exception as e:
-            # bir feed bozulsa diğerleri devam etsin
-            print("medRxiv feed parse failed:", url, e)
+# bir feed bozulsa diğerleri devam etsin
+SKIP_FAILED_REQUESTS = True
 
-    # URL bazlı dedup
-    dedup = {it["url"]: it for it in items if it.get("url")}
-    return list(dedup.values())
+def plan_requests(cfg, window=None):
+    limit = int(cfg.get("max_items_per_feed", 30))
+    return [{"url": url, "headers": HEADERS, "source": "medRxiv", "limit": limit} for url in cfg.get("feeds", [])]
 
-def _parse_atom(url, source="medRxiv", limit=30):
-    r = requests.get(url, timeout=30, headers={"User-Agent": "ArtheraSeriesBot/1.0"})
-    r.raise_for_status()
+def parse_response(req, r):
+    return _parse_atom(r.text, source=req["source"], limit=req["limit"])
 
-    root = ET.fromstring(r.text)
+def _parse_atom(text, source="medRxiv", limit=30):
+    root = ET.fromstring(text)
 
     # Atom feed: entry'ler namespace'li olabilir, wildcard ile yakala
     entries = root.findall(".//{*}entry")
@@ -1,17 +1,23 @@
 
-import time
-import requests
-from .utils import stable_id, clean_text
+from datetime import date, timedelta
+from .utils import stable_id, clean_text, http_get
 
 BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
 
-def fetch_pubmed_items(cfg):
+def fetch_pubmed_items(cfg, window=None):
     retmax = int(cfg.get("retmax", 8))
     days = int(cfg.get("days", 30))
     terms = cfg.get("terms", [])
 
     query = " OR ".join([t if t.startswith("(") else f"({t})" for t in terms])
-    pmids = _esearch(query, retmax=retmax, reldate=days)
+    if window:
+        # [başlangıç, bitiş) → PubMed mindate/maxdate uçları dahil
+        start, end = window
+        last = date.fromisoformat(end) - timedelta(days=1)
+        pmids = _esearch(query, retmax=retmax,
+                         mindate=start.replace("-", "/"), maxdate=last.isoformat().replace("-", "/"))
+    else:
+        pmids = _esearch(query, retmax=retmax, reldate=days)
     if not pmids:
         return []
 
@@ -33,28 +39,32 @@ def fetch_pubmed_items(cfg):
         })
     return items
 
-def _esearch(term, retmax=10, reldate=30):
+def _esearch(term, retmax=10, reldate=30, mindate=None, maxdate=None):
     url = BASE + "esearch.fcgi"
     params = {
         "db": "pubmed",
         "term": term,
         "retmode": "json",
         "retmax": retmax,
-        "reldate": reldate,
         "datetype": "pdat",
         "sort": "date"
     }
-    r = requests.get(url, params=params, timeout=30)
-    r.raise_for_status()
-    time.sleep(0.35)
+    if mindate and maxdate:
+        params["mindate"] = mindate
+        params["maxdate"] = maxdate
+    else:
+        params["reldate"] = reldate
+    r = http_get(url, params=params, timeout=30)
+    if r is None:
+        return []
     return r.json().get("esearchresult", {}).get("idlist", [])
 
 def _esummary(pmids):
     url = BASE + "esummary.fcgi"
     params = {"db": "pubmed", "id": ",".join(pmids), "retmode": "json"}
-    r = requests.get(url, params=params, timeout=30)
-    r.raise_for_status()
-    time.sleep(0.35)
+    r = http_get(url, params=params, timeout=30)
+    if r is None:
+        return []
     data = r.json().get("result", {})
     uids = data.get("uids", [])
     return [data[uid] for uid in uids if uid in data]
@@ -3,22 +3,53 @@ import json
 
 STATE_FILE = "state.json"
 
-def load_state():
+# Backfill'in gördüğü URL'ler ayrı tutulur: canlı seen_urls kuyruğunun max_keep
+# kırpması geçmiş haftalar yüzünden güncel kayıtları düşürmesin.
+BACKFILL_KEY = "backfill_urls"
+
+def load_state(path=STATE_FILE):
     try:
-        with open(STATE_FILE, "r", encoding="utf-8") as f:
+        with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except FileNotFoundError:
         return {"seen_urls": [], "last_run_utc": None}
 
-def save_state(state):
-    with open(STATE_FILE, "w", encoding="utf-8") as f:
+def save_state(state, path=STATE_FILE):
+    with open(path, "w", encoding="utf-8") as f:
         json.dump(state, f, ensure_ascii=False, indent=2)
 
-def filter_new(items, state, max_keep=5000):
-    seen = set(state.get("seen_urls", []))
+def known_urls(state):
+    """Canlı ve backfill kayıtlarının birleşimi: ikisinde de görülen URL tekrar yayınlanmaz."""
+    return set(state.get("seen_urls", [])) | set(state.get(BACKFILL_KEY, []))
+
+def filter_new(items, state, max_keep=5000, key="seen_urls"):
+    """
+    Görülmemiş kayıtları döndürür ve URL'lerini state[key] sonuna ekler.
+    max_keep=None: kırpma yok (backfill listesi tarih aralığıyla sınırlıdır).
+    """
+    seen = known_urls(state)
     fresh = [it for it in items if it["url"] not in seen]
+    bucket = state.setdefault(key, [])
     for it in fresh:
-        state.setdefault("seen_urls", []).append(it["url"])
-    state["seen_urls"] = state["seen_urls"][-max_keep:]
+        bucket.append(it["url"])
+    if max_keep is not None:
+        state[key] = bucket[-max_keep:]
     return fresh
 
+def merge_seen(state, deltas, max_keep=5000):
+    """
+    Shard delta'larını state'e birleştirir (grow-only set).
+    delta: {"seen": [[url, görülme_zamanı_utc], ...]}
+    Yeni URL'ler (zaman, url) sırasıyla eklenir; birleştirme sırasından bağımsız, deterministiktir.
+    seen_urls zaman sıralı kaldığından max_keep kırpması en eski kayıtları düşürür; kırpma
+    sayıya göredir (son max_keep URL), görülme zamanına göre bir süre aşımı yoktur.
+    """
+    seen = state.setdefault("seen_urls", [])
+    known = set(seen)
+    entries = sorted({(ts or "", url) for d in deltas for url, ts in d.get("seen", [])})
+    for _, url in entries:
+        if url not in known:
+            known.add(url)
+            seen.append(url)
+    state["seen_urls"] = seen[-max_keep:]
+    return state
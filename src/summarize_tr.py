@@ -1,8 +1,12 @@
 
+import math
 import re
 from collections import Counter
 from .utils import clean_text
 
+_WORD_RE = re.compile(r"[a-zA-ZçğıöşüÇĞİÖŞÜ]+")
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
 TR_STOP = set("""
 ve veya ile ama fakat çünkü için gibi daha çok az en mı mi mu mü ya da
 bir bu şu o ki olarak ise değil üzerinde arasında kadar
@@ -49,7 +53,7 @@ def _has_turkish_chars(text: str) -> bool:
 
 def _extract_keywords(text: str, lang: str = "en", topk: int = 6):
     text = clean_text(text).lower()
-    words = re.findall(r"[a-zA-ZçğıöşüÇĞİÖŞÜ]+", text)
+    words = _WORD_RE.findall(text)
     if lang == "tr":
         words = [w for w in words if w not in TR_STOP and len(w) > 2]
     else:
@@ -68,40 +72,17 @@ def _translate_phrase_simple(text: str) -> str:
             t = t.replace(k, GLOSSARY[k])
     return clean_text(t)
 
-def summarize_tr(title: str, snippet: str, max_sentences: int = 2) -> str:
-    """
-    - Türkçe metinse: extractive özet
-    - Değilse: ücretsiz TR şablon + sözlük tabanlı 'anlamsal' özet
-    """
-    title = clean_text(title or "")
-    snippet = clean_text(snippet or "")
-    full = clean_text(f"{title}. {snippet}")
-
-    if _has_turkish_chars(full):
-        # --- Basit extractive (Türkçe) ---
-        sents = re.split(r"(?<=[.!?])\s+", full)
-        sents = [s.strip() for s in sents if len(s.strip()) > 30]
-        if not sents:
-            return snippet[:240]
-
-        words = re.findall(r"[a-zA-ZçğıöşüÇĞİÖŞÜ]+", full.lower())
-        words = [w for w in words if w not in TR_STOP and len(w) > 2]
-        freq = Counter(words)
-
-        def score(sent):
-            ws = re.findall(r"[a-zA-ZçğıöşüÇĞİÖŞÜ]+", sent.lower())
-            return sum(freq.get(w, 0) for w in ws)
-
-        ranked = sorted(sents, key=score, reverse=True)
-        return " ".join(ranked[:max_sentences])
+def _content_terms(words, lang):
+    stop = TR_STOP if lang == "tr" else EN_STOP
+    return [w for w in words if w not in stop and len(w) > 2]
 
+def _template_summary(title: str, snippet: str, keywords) -> str:
     # --- Yabancı içerik (EN ağırlıklı) → Türkçe şablonlu özet ---
     tr_title_hint = _translate_phrase_simple(title)
     tr_snip_hint = _translate_phrase_simple(snippet)
 
-    # Anahtar kelime çıkar + Türkçeleştir
-    kws = _extract_keywords(full, lang="en", topk=6)
-    kw_line = ", ".join([_translate_phrase_simple(k) for k in kws])
+    # Anahtar kelime Türkçeleştir
+    kw_line = ", ".join([_translate_phrase_simple(k) for k in keywords])
 
     # Şablonlu kısa özet
     # Amaç: mailde okunabilir, Türkçe, klinik neutral.
@@ -113,3 +94,79 @@ def summarize_tr(title: str, snippet: str, max_sentences: int = 2) -> str:
     if kw_line:
         parts.append(f"Anahtar kavramlar: {kw_line}.")
     return " ".join(parts).strip()
+
+def _tokenize(it):
+    title = clean_text(it.get("title") or "")
+    snippet = clean_text(it.get("snippet") or "")
+    full = clean_text(f"{title}. {snippet}")
+    lang = "tr" if _has_turkish_chars(full) else "en"
+
+    # Cümleler boşlukta bölündüğü için cümle token'larının birleşimi tüm metnin token'larıdır.
+    sents = _SENT_SPLIT_RE.split(full)
+    sent_words = [_WORD_RE.findall(sent.lower()) for sent in sents]
+    tf = Counter(_content_terms([w for ws in sent_words for w in ws], lang))
+    return title, snippet, lang, sents, sent_words, tf
+
+def _idf_table(term_sets):
+    df = Counter()
+    n = 0
+    for terms in term_sets:
+        df.update(terms)
+        n += 1
+    return {w: math.log((1 + n) / (1 + c)) + 1.0 for w, c in df.items()}
+
+def corpus_idf(items):
+    """
+    Çalıştırmanın tüm kayıtlarından IDF tablosu (kelime → ağırlık).
+    Ana süreçte bir kez hesaplanıp summarize_tr_batch(..., idf=) ile işçilere verilir;
+    böylece her seri aynı doküman frekanslarıyla puanlanır.
+    """
+    return _idf_table(_tokenize(it)[-1].keys() for it in items)
+
+def summarize_tr_batch(items, max_sentences=2, idf=None):
+    """
+    Bir çalıştırmadaki tüm kayıtları (title/snippet) tek geçişte özetler.
+    - Metinler bir kez tokenize edilir; doküman frekansı (IDF) tüm kayıtlardan hesaplanır
+      (idf verilirse o tablo kullanılır, bkz. corpus_idf).
+    - Cümle/anahtar kelime puanı = kayıt içi frekans × IDF.
+    - max_sentences tek sayı ya da kayıt başına liste olabilir.
+    Tek kayıtlık çağrıda IDF sabit olduğundan sonuç summarize_tr ile aynıdır.
+    """
+    if isinstance(max_sentences, int):
+        max_sentences = [max_sentences] * len(items)
+
+    docs = [_tokenize(it) for it in items]
+    if idf is None:
+        idf = _idf_table(d[-1].keys() for d in docs)
+    # Tabloda olmayan kelime (tablo başka bir kümeden geldiyse): en nadir kelime ağırlığı
+    unseen = max(idf.values(), default=1.0)
+
+    out = []
+    for (title, snippet, lang, sents, sent_words, tf), k in zip(docs, max_sentences):
+        weights = {w: c * idf.get(w, unseen) for w, c in tf.items()}
+
+        if lang == "tr":
+            # --- Basit extractive (Türkçe) ---
+            scored = [
+                (sum(weights.get(w, 0) for w in ws), sent.strip())
+                for sent, ws in zip(sents, sent_words)
+                if len(sent.strip()) > 30
+            ]
+            if not scored:
+                out.append(snippet[:240])
+                continue
+            ranked = sorted(scored, key=lambda p: p[0], reverse=True)
+            out.append(" ".join(sent for _, sent in ranked[:k]))
+            continue
+
+        # Counter.most_common ile aynı sıralama: eşit puanda ilk geçen önce gelir.
+        keywords = [w for w, _ in sorted(weights.items(), key=lambda p: p[1], reverse=True)[:6]]
+        out.append(_template_summary(title, snippet, keywords))
+    return out
+
+def summarize_tr(title: str, snippet: str, max_sentences: int = 2) -> str:
+    """
+    - Türkçe metinse: extractive özet
+    - Değilse: ücretsiz TR şablon + sözlük tabanlı 'anlamsal' özet
+    """
+    return summarize_tr_batch([{"title": title, "snippet": snippet}], max_sentences)[0]
@@ -0,0 +1,78 @@
+"""
+Birden çok config (klinik/marka) için toplu çalıştırma.
+
+Her config normal config.json biçimindedir; isteğe bağlı "tenant" bloğu ile
+kendi state dosyası, çıktı klasörü ve e-posta alıcısı verilebilir:
+
+    "tenant": {"name": "arthera", "state_file": "state.json", "out_dir": "out", "mail_to": "a@b.com"}
+
+"tenant" bloğu (ya da içinde "name") yoksa config tek çalıştırmadaki varsayılanları
+kullanır: state.json, out/, MAIL_TO. "name" verilmiş ama state_file/out_dir verilmemişse
+bunlar addan türetilir (state_<ad>.json, out_<ad>). İki tenant aynı state dosyasını ya da
+çıktı klasörünü gösterirse hiçbir tenant çalıştırılmadan hata verilir.
+
+Tüm config'ler aynı süreçte, ortak istek önbelleği (utils.shared_fetch_cache) ile
+çalışır: aynı feed / PubMed sorgusu / Google News araması yalnızca bir kez çekilir,
+sonuç her tenant'ın kendi state ve çıktılarına dağıtılır.
+
+Kullanım:
+    python -m src.tenants config.json configs/diger_klinik.json
+"""
+import argparse
+import json
+import os
+from typing import List, Dict, Any, Tuple
+
+from .main import run
+from .state_store import STATE_FILE
+from .utils import shared_fetch_cache
+
+
+def load_tenant(path: str) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        cfg = json.load(f)
+    tenant = dict(cfg.get("tenant", {}))
+    if tenant.get("name"):
+        name = tenant["name"]
+        tenant.setdefault("state_file", f"state_{name}.json")
+        tenant.setdefault("out_dir", f"out_{name}")
+    else:
+        name = os.path.splitext(os.path.basename(path))[0]
+        tenant.setdefault("state_file", STATE_FILE)
+        tenant.setdefault("out_dir", "out")
+    return name, cfg, tenant
+
+def check_tenant_paths(tenants: List[Tuple[str, Dict[str, Any], Dict[str, Any]]]) -> None:
+    """Aynı state dosyasını ya da çıktı klasörünü paylaşan tenant'lar birbirinin kaydını ezer."""
+    for key in ("state_file", "out_dir"):
+        owners = {}
+        for name, _, tenant in tenants:
+            path = os.path.normcase(os.path.abspath(tenant[key]))
+            if path in owners:
+                raise ValueError(f"{owners[path]} ve {name} aynı {key} değerini kullanıyor: {tenant[key]}")
+            owners[path] = name
+
+def run_tenants(paths: List[str]) -> None:
+    tenants = [load_tenant(p) for p in paths]
+    check_tenant_paths(tenants)
+
+    with shared_fetch_cache() as stats:
+        for name, cfg, tenant in tenants:
+            print(f"===== [TENANT] {name} =====")
+            run(cfg, cfg.get("series", []),
+                state_file=tenant["state_file"],
+                out_dir=tenant["out_dir"],
+                mail_to=tenant.get("mail_to"))
+
+    print(f"[BATCH] {len(tenants)} tenant, {stats['requests']} istek, {stats['fetched']} benzersiz çekim.")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Birden çok config'i ortak çekimle çalıştırır.")
+    ap.add_argument("configs", nargs="+", help="Tenant config dosyaları")
+    args = ap.parse_args()
+    run_tenants(args.configs)
+
+
+if __name__ == "__main__":
+    main()
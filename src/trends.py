@@ -0,0 +1,292 @@
+"""
+Haftalık trend istatistikleri.
+
+Her çalıştırmada yeni kayıtlar seri × tür × kaynak × ISO hafta sayaçlarına eklenir
+(out/ arşivi yeniden okunmaz). Depo iki dosyadır:
+    out/_trends/trends.json     boyut sözlükleri (seri/tür/kaynak/hafta adları) + dönem başına öne çıkan
+                                kavramlar + geçerli sayaç dosyasının adı ("bin")
+    out/_trends/trends.{a,b}.bin sütunlu sayaçlar: series, kind, source, week, count (her biri uint32 dizisi)
+Kayıt atomiktir: sayaçlar o an kullanılmayan bin dosyasına yazılır, ardından trends.json
+(tmp + os.replace) onu gösterecek şekilde değiştirilir. Arada kesilirse eski başlık eski,
+bozulmamış sayaçları gösterir; applied_shards ile sayaçlar hiçbir zaman ayrışmaz.
+
+Sorgu:
+    python -m src.trends --series skolyoz --kind paper --by month --year 2026
+    python -m src.trends --series skolyoz --keywords
+
+Depo kurulmadan önceki haftalar için tek seferlik doldurma (out/<seri>/*.md arşivinden):
+    python -m src.trends --bootstrap
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from array import array
+from collections import Counter
+from datetime import date, timedelta
+from typing import List, Dict, Any, Tuple
+
+from .summarize_tr import _extract_keywords, _has_turkish_chars
+
+TRENDS_DIR = "out/_trends"
+COLUMNS = ("series", "kind", "source", "week", "count")
+DIMS = COLUMNS[:-1]
+TOP_KEYWORDS = 20
+
+KIND_LABELS = {"review": "Cochrane", "paper": "PubMed", "preprint": "medRxiv", "news": "Haber"}
+
+# Arşiv Markdown'ındaki bölüm başlığı → (tür, kaynak)
+ARCHIVE_SECTIONS = (
+    ("(Cochrane)", "review", "Cochrane"),
+    ("(PubMed)", "paper", "PubMed"),
+    ("(medRxiv)", "preprint", "medRxiv"),
+    ("(Google News)", "news", "Google News"),
+)
+_RANGE_TITLE_RE = re.compile(r"\((\d{4}-\d{2}-\d{2}) / \d{4}-\d{2}-\d{2}\)")
+
+
+def iso_week(d: date) -> str:
+    y, w, _ = d.isocalendar()
+    return f"{y}-W{w:02d}"
+
+def week_monday(week: str) -> date:
+    y, w = week.split("-W")
+    return date.fromisocalendar(int(y), int(w), 1)
+
+def previous_weeks(week: str, n: int) -> List[str]:
+    monday = week_monday(week)
+    return [iso_week(monday - timedelta(weeks=i)) for i in range(1, n + 1)]
+
+
+BIN_SLOTS = ("trends.a.bin", "trends.b.bin")
+
+
+def load_trends(root: str = TRENDS_DIR) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(root, "trends.json"), "r", encoding="utf-8") as f:
+            header = json.load(f)
+    except FileNotFoundError:
+        header = {"dims": {d: [] for d in DIMS}, "keywords": {}}
+
+    cols = [array("I") for _ in COLUMNS]
+    # "bin" anahtarı olmayan eski depolar tek trends.bin dosyası kullanır.
+    bin_path = os.path.join(root, header.get("bin", "trends.bin"))
+    if os.path.exists(bin_path):
+        with open(bin_path, "rb") as f:
+            data = f.read()
+        n = len(data) // (len(COLUMNS) * cols[0].itemsize)
+        width = n * cols[0].itemsize
+        for i, col in enumerate(cols):
+            col.frombytes(data[i * width:(i + 1) * width])
+            if sys.byteorder == "big":
+                col.byteswap()
+
+    lookup = {d: {name: i for i, name in enumerate(header["dims"][d])} for d in DIMS}
+    index = {tuple(col[r] for col in cols[:-1]): r for r in range(len(cols[0]))}
+    return {"header": header, "cols": cols, "lookup": lookup, "index": index}
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def save_trends(store: Dict[str, Any], root: str = TRENDS_DIR) -> None:
+    os.makedirs(root, exist_ok=True)
+    header = store["header"]
+    # Geçerli başlığın göstermediği yuvaya yaz; başlık değişene kadar eski sayaçlar yerinde kalır.
+    target = BIN_SLOTS[1] if header.get("bin") == BIN_SLOTS[0] else BIN_SLOTS[0]
+
+    data = bytearray()
+    for col in store["cols"]:
+        out = array("I", col)
+        if sys.byteorder == "big":
+            out.byteswap()
+        data += out.tobytes()
+    _write_atomic(os.path.join(root, target), bytes(data))
+
+    # Tek işleme noktası: başlık (sözlükler, applied_shards, "bin") yeni sayaçları gösterir.
+    new_header = dict(header, bin=target)
+    _write_atomic(os.path.join(root, "trends.json"),
+                  json.dumps(new_header, ensure_ascii=False, indent=2).encode("utf-8"))
+    header["bin"] = target
+
+def _dim_id(store: Dict[str, Any], dim: str, name: str) -> int:
+    ids = store["lookup"][dim]
+    if name not in ids:
+        ids[name] = len(store["header"]["dims"][dim])
+        store["header"]["dims"][dim].append(name)
+    return ids[name]
+
+
+def update_trends(store: Dict[str, Any], series_items: List[Tuple[str, List[Dict[str, Any]]]], week: str) -> None:
+    """Yeni kayıtları sayaçlara ekler; maliyet yalnızca kayıt sayısıyla orantılıdır."""
+    cols, index = store["cols"], store["index"]
+    w = _dim_id(store, "week", week)
+    for series_key, items in series_items:
+        s = _dim_id(store, "series", series_key)
+        terms = Counter()
+        for it in items:
+            key = (s, _dim_id(store, "kind", it.get("kind", "other")), _dim_id(store, "source", it.get("source", "")), w)
+            row = index.get(key)
+            if row is None:
+                index[key] = len(cols[0])
+                for col, v in zip(cols, key + (1,)):
+                    col.append(v)
+            else:
+                cols[-1][row] += 1
+
+            title = it.get("title", "")
+            terms.update(_extract_keywords(title, lang="tr" if _has_turkish_chars(title) else "en", topk=6))
+
+        if terms:
+            period = store["header"]["keywords"].setdefault(series_key, {})
+            terms.update(dict(period.get(week, [])))
+            period[week] = [[k, c] for k, c in terms.most_common(TOP_KEYWORDS)]
+
+def query_trends(store: Dict[str, Any], series: str = None, kind: str = None, source: str = None,
+                 by: str = "week") -> Dict[str, Dict[str, int]]:
+    """Dönem → {tür: sayı}. by: "week" ya da "month"."""
+    dims = store["header"]["dims"]
+    want = {"series": series, "kind": kind, "source": source}
+    want_ids = {d: store["lookup"][d].get(v, -1) for d, v in want.items() if v}
+
+    out = {}
+    s_col, k_col, src_col, w_col, c_col = store["cols"]
+    for r in range(len(c_col)):
+        row = {"series": s_col[r], "kind": k_col[r], "source": src_col[r]}
+        if any(row[d] != i for d, i in want_ids.items()):
+            continue
+        week = dims["week"][w_col[r]]
+        period = week if by == "week" else week_monday(week).strftime("%Y-%m")
+        bucket = out.setdefault(period, {})
+        kind_name = dims["kind"][k_col[r]]
+        bucket[kind_name] = bucket.get(kind_name, 0) + c_col[r]
+    return dict(sorted(out.items()))
+
+def series_trend(store: Dict[str, Any], series_key: str, week: str, n_weeks: int = 4) -> Dict[str, Any]:
+    """
+    Bu haftanın sayıları, önceki n_weeks hafta içinden depoda bulunanların ortalaması ve
+    öne çıkan kavramlar. Depo kurulmadan önceki haftalar ortalamaya 0 olarak girmez;
+    hiç geçmiş hafta yoksa n_weeks=0 olur ve karşılaştırma yapılmaz.
+    """
+    by_week = query_trends(store, series=series_key)
+    history = [w for w in previous_weeks(week, n_weeks) if w in store["lookup"]["week"]]
+    current = by_week.get(week, {})
+    prev = [by_week.get(w, {}) for w in history]
+    kinds = sorted(set(current) | {k for p in prev for k in p})
+    return {
+        "week": week,
+        "n_weeks": len(history),
+        "current": {k: current.get(k, 0) for k in kinds},
+        "prev_avg": {k: sum(p.get(k, 0) for p in prev) / len(history) for k in kinds} if history else {},
+        "keywords": [k for k, _ in store["header"]["keywords"].get(series_key, {}).get(week, [])[:8]],
+    }
+
+def trend_lines(trend: Dict[str, Any]) -> List[str]:
+    """Markdown/e-posta için: "PubMed: 3 (önceki 4 hafta ort. 1.5, ↑)" satırları; geçmiş yoksa boş."""
+    if not trend["n_weeks"]:
+        return []
+    lines = []
+    for k in ("review", "paper", "preprint", "news"):
+        if k not in trend["current"]:
+            continue
+        cur, avg = trend["current"][k], trend["prev_avg"][k]
+        arrow = "↑" if cur > avg else ("↓" if cur < avg else "→")
+        lines.append(f"{KIND_LABELS[k]}: {cur} (önceki {trend['n_weeks']} hafta ort. {avg:.1f}, {arrow})")
+    if trend["keywords"]:
+        lines.append("Öne çıkan kavramlar: " + ", ".join(trend["keywords"]))
+    return lines
+
+
+def parse_archive_markdown(text: str) -> List[Dict[str, Any]]:
+    """build_series_markdown çıktısından (tür, kaynak, başlık) kayıtları."""
+    items, section = [], None
+    for line in text.splitlines():
+        if line.startswith("## "):
+            section = next(((kind, source) for tag, kind, source in ARCHIVE_SECTIONS if tag in line), None)
+        elif line.startswith("### ") and section:
+            items.append({"kind": section[0], "source": section[1], "title": line[4:].strip()})
+    return items
+
+def bootstrap_from_archive(store: Dict[str, Any], out_dir: str = "out") -> int:
+    """
+    out/<seri>/YYYY-MM-DD_*.md arşivinden depoda olmayan (seri, hafta) çiftlerini doldurur;
+    eklenen çift sayısını döndürür. Depoda zaten bulunan çiftler atlandığından tekrar
+    çalıştırmak sayıları ikilemez.
+    Not: Markdown bölüm başına en çok 10 (haberlerde 15) kayıt gösterdiği için bu
+    haftaların sayıları o sınırlarla kırpılmıştır. Haber kaynakları "Google News" altında toplanır.
+    """
+    dims = store["header"]["dims"]
+    s_col, _, _, w_col, _ = store["cols"]
+    existing = {(dims["series"][s], dims["week"][w]) for s, w in zip(s_col, w_col)}
+
+    groups = {}
+    for series_key in sorted(os.listdir(out_dir)):
+        series_dir = os.path.join(out_dir, series_key)
+        if series_key.startswith("_") or not os.path.isdir(series_dir):
+            continue
+        for name in sorted(os.listdir(series_dir)):
+            if not name.endswith(".md"):
+                continue
+            try:
+                day = date.fromisoformat(name[:10])
+            except ValueError:
+                continue
+            with open(os.path.join(series_dir, name), "r", encoding="utf-8") as f:
+                text = f.read()
+            # Backfill dosyaları pencerenin son günüyle adlanır; hafta başlıktaki başlangıçtan alınır.
+            m = _RANGE_TITLE_RE.search(text.split("\n", 1)[0])
+            week = iso_week(date.fromisoformat(m.group(1)) if m else day)
+            if (series_key, week) in existing:
+                continue
+            groups.setdefault((series_key, week), []).extend(parse_archive_markdown(text))
+
+    for (series_key, week), items in sorted(groups.items()):
+        update_trends(store, [(series_key, items)], week)
+    return len(groups)
+
+def main():
+    ap = argparse.ArgumentParser(description="Seri trend istatistiklerini sorgular (arşivi taramadan).")
+    ap.add_argument("--series", help="Seri anahtarı")
+    ap.add_argument("--kind", choices=sorted(KIND_LABELS), help="Kayıt türü")
+    ap.add_argument("--source", help="Kaynak adı (ör. PubMed)")
+    ap.add_argument("--by", choices=("week", "month"), default="week")
+    ap.add_argument("--year", help="Yalnızca bu yıl (YYYY)")
+    ap.add_argument("--keywords", action="store_true", help="Dönem başına öne çıkan kavramları göster")
+    ap.add_argument("--dir", default=TRENDS_DIR, help="Trend deposu klasörü")
+    ap.add_argument("--bootstrap", action="store_true", help="Depoda olmayan geçmiş haftaları out/ arşivinden doldur")
+    ap.add_argument("--archive", default="out", help="--bootstrap için Markdown arşivi klasörü")
+    args = ap.parse_args()
+
+    store = load_trends(args.dir)
+
+    if args.bootstrap:
+        added = bootstrap_from_archive(store, args.archive)
+        save_trends(store, args.dir)
+        print(f"[TRENDS] Arşivden {added} seri-hafta eklendi: {args.dir}")
+        return
+
+    if args.keywords:
+        for series_key, periods in sorted(store["header"]["keywords"].items()):
+            if args.series and series_key != args.series:
+                continue
+            for week, kws in sorted(periods.items()):
+                if args.year and not week.startswith(args.year):
+                    continue
+                print(f"{series_key}\t{week}\t" + ", ".join(f"{k}({c})" for k, c in kws[:10]))
+        return
+
+    rows = query_trends(store, series=args.series, kind=args.kind, source=args.source, by=args.by)
+    for period, counts in rows.items():
+        if args.year and not period.startswith(args.year):
+            continue
+        detail = " | ".join(f"{KIND_LABELS.get(k, k)}={v}" for k, v in sorted(counts.items()))
+        print(f"{period}\t{sum(counts.values())}\t{detail}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,28 @@
 import re
 import time
 import hashlib
-from urllib.parse import urlencode
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlencode, urlparse
+
+import requests
+
+# Host bazlı minimum istek aralığı (saniye). Paralel çalışan işçiler de
+# aynı sınırı paylaşır; NCBI anahtarsız kullanımda ~3 istek/sn izin verir.
+HOST_MIN_INTERVAL = {
+    "eutils.ncbi.nlm.nih.gov": 0.35,
+    "news.google.com": 0.25,
+}
+
+_throttle_lock = threading.Lock()
+_host_next_slot = {}
+
+# shared_fetch_cache() etkinken aynı GET isteği bir kez yapılır (ör. çoklu config çalıştırması).
+_fetch_cache = None
+_fetch_cache_lock = threading.Lock()
+
+# conditional_requests() etkinken http_get ETag/Last-Modified ile koşullu istek yapar.
+_validators = None
 
 def now_utc_iso():
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
@@ -19,3 +40,101 @@ def stable_id(*parts: str) -> str:
 def build_query_params(params: dict) -> str:
     return urlencode(params, safe=":+\"")
 
+def throttle(url: str) -> None:
+    """Aynı host'a giden istekleri HOST_MIN_INTERVAL kadar aralıklarla sıraya koyar."""
+    host = urlparse(url).netloc
+    interval = HOST_MIN_INTERVAL.get(host, 0.0)
+    if interval <= 0:
+        return
+    with _throttle_lock:
+        now = time.monotonic()
+        slot = max(now, _host_next_slot.get(host, 0.0))
+        _host_next_slot[host] = slot + interval
+    if slot > now:
+        time.sleep(slot - now)
+
+@contextmanager
+def shared_fetch_cache():
+    """
+    Blok boyunca http_get yanıtlarını (url, params) anahtarıyla bellekte tutar.
+    Dönen sözlükte "requests" (toplam) ve "fetched" (ağa giden) sayaçları bulunur.
+    """
+    global _fetch_cache
+    stats = {"requests": 0, "fetched": 0}
+    _fetch_cache = {"responses": {}, "stats": stats}
+    try:
+        yield stats
+    finally:
+        _fetch_cache = None
+
+@contextmanager
+def conditional_requests(validators):
+    """
+    Blok boyunca http_get isteklerine If-None-Match / If-Modified-Since ekler.
+    validators: istek → {"etag", "last_modified"} sözlüğü; yerinde güncellenir, çağıran saklar.
+    304 (değişmedi) yanıtında http_get None döner.
+    """
+    global _validators
+    _validators = validators
+    try:
+        yield validators
+    finally:
+        _validators = None
+
+def http_get(url, params=None, headers=None, timeout=30):
+    """GET + host kısıtlaması. conditional_requests() içinde 304 yanıtı için None döner."""
+    cache = _fetch_cache
+    key = None
+    if cache is not None:
+        key = (url, tuple(sorted((params or {}).items())))
+        with _fetch_cache_lock:
+            cache["stats"]["requests"] += 1
+            if key in cache["responses"]:
+                return cache["responses"][key]
+
+    validators = _validators
+    vkey = None
+    if validators is not None:
+        vkey = url + ("?" + urlencode(sorted((params or {}).items())) if params else "")
+        v = validators.get(vkey, {})
+        headers = dict(headers or {})
+        if v.get("etag"):
+            headers["If-None-Match"] = v["etag"]
+        if v.get("last_modified"):
+            headers["If-Modified-Since"] = v["last_modified"]
+
+    throttle(url)
+    r = requests.get(url, params=params, headers=headers, timeout=timeout)
+    if r.status_code == 304:
+        r = None
+    else:
+        r.raise_for_status()
+        if validators is not None and (r.headers.get("ETag") or r.headers.get("Last-Modified")):
+            validators[vkey] = {"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}
+
+    if cache is not None:
+        with _fetch_cache_lock:
+            cache["stats"]["fetched"] += 1
+            cache["responses"][key] = r
+    return r
+
+def run_plan(requests_plan, parse, skip_failed=False):
+    """
+    Kaynak sözleşmesinin ortak yürütücüsü: planlanan her isteği http_get ile çeker,
+    parse(req, response) ile kayıtlara çevirir ve URL bazlı dedup yapar.
+    skip_failed: bozuk bir feed diğerlerini durdurmasın (medRxiv/Cochrane davranışı).
+    """
+    items = []
+    for req in requests_plan:
+        try:
+            r = http_get(req["url"], params=req.get("params"), headers=req.get("headers"), timeout=30)
+            if r is None:  # 304: değişiklik yok
+                continue
+            items.extend(parse(req, r))
+        except Exception as e:
+            if not skip_failed:
+                raise
+            print(f"{req.get('source', '')} feed parse failed:", req["url"], e)
+
+    dedup = {it["url"]: it for it in items if it.get("url")}
+    return list(dedup.values())
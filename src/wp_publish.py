@@ -18,3 +18,25 @@ def wp_create_post(wp_url, username, app_pass, title, content, status="draft", c
         raise RuntimeError(f"WP post create failed: {r.status_code} {r.text}")
     return r.json()
 
+def wp_session(username, app_pass, pool_size=8):
+    """Tüm WP istekleri için tek bağlantı havuzu + Basic auth."""
+    s = requests.Session()
+    s.auth = (username, app_pass)
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+def wp_create_post_with_session(session, wp_url, title, content, status="draft", categories=None, tags=None):
+    api = wp_url.rstrip("/") + "/wp-json/wp/v2/posts"
+
+    payload = {"title": title, "content": content, "status": status}
+    if categories:
+        payload["categories"] = categories
+    if tags:
+        payload["tags"] = tags
+
+    r = session.post(api, json=payload, timeout=30)
+    if r.status_code not in (200, 201):
+        raise RuntimeError(f"WP post create failed: {r.status_code} {r.text}")
+    return r.json()
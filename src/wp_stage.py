@@ -0,0 +1,170 @@
+"""
+WordPress yayın aşaması.
+
+Raporlardaki seri Markdown'ını HTML'e çevirip WordPress'e yazı olarak gönderir. Metin
+rapordan okunur (shard report.json'ı da taşır); merge başka makinede çalışsa bile yerel dosya gerekmez.
+- Kategori/etiket ad→id eşlemesi site bazında out/_wordpress/wp_cache.json içinde saklanır
+  (CI out/ klasörünü commit'lediği için çalıştırmalar arasında korunur); yalnızca önbellekte
+  olmayan bir ad gerektiğinde tüm liste (sayfalı) bir kez yeniden çekilir.
+- Eksik terimler tek geçişte oluşturulur.
+- Yazılar tek bir bağlantı havuzu (requests.Session) üzerinden eşzamanlı gönderilir.
+- Gönderilen her derlemenin post id'si "<seri>/<tarih>" anahtarıyla saklanır; aynı günün
+  derlemesi (yeniden çalıştırmada dosya adı değişse de) ikinci kez gönderilmez.
+
+config.json:
+    "wordpress": {"url": "https://site.com", "status": "draft", "category": "Fizyoterapi", "tags": [], "workers": 4}
+Seri bazında "wordpress": {"category": "...", "tags": [...]} ile ezilebilir.
+Kimlik bilgileri ortamdan okunur: WP_USER, WP_APP_PASS (isteğe bağlı WP_URL).
+
+Yerel WP stand-in'ine karşı test: python -m pytest -q tests (bkz. tests/wp_stub.py).
+"""
+import html
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any
+
+from .wp_publish import wp_session, wp_create_post_with_session
+from .wp_terms import list_terms, create_term
+
+WP_CACHE_FILE = os.path.join("out", "_wordpress", "wp_cache.json")
+
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_RE = re.compile(r"^_(.+)_$")
+_URL_RE = re.compile(r"(https?://[^\s<]+)")
+
+
+def load_wp_cache(path: str = WP_CACHE_FILE) -> Dict[str, Any]:
+    """Site URL'si → {"categories", "tags", "posts"}; farklı sitelerin id'leri karışmaz."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_wp_cache(cache: Dict[str, Any], path: str = WP_CACHE_FILE) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2)
+
+
+def _inline(text: str) -> str:
+    t = html.escape(text, quote=False)
+    t = _BOLD_RE.sub(r"<strong>\1</strong>", t)
+    t = _URL_RE.sub(r'<a href="\1">\1</a>', t)
+    m = _ITALIC_RE.match(t)
+    if m:
+        t = f"<em>{m.group(1)}</em>"
+    return t
+
+def markdown_to_html(md: str) -> str:
+    """build_series_markdown çıktısında kullanılan alt küme: başlık, alıntı, liste, çizgi, paragraf."""
+    out = []
+    in_list = False
+    for raw in md.splitlines():
+        line = raw.rstrip()
+        is_item = line.startswith("- ")
+        if in_list and not is_item:
+            out.append("</ul>")
+            in_list = False
+
+        if not line:
+            continue
+        if is_item:
+            if not in_list:
+                out.append("<ul>")
+                in_list = True
+            out.append(f"<li>{_inline(line[2:])}</li>")
+        elif line == "---":
+            out.append("<hr />")
+        elif line.startswith("#"):
+            level = min(len(line) - len(line.lstrip("#")), 6)
+            out.append(f"<h{level}>{_inline(line[level:].strip())}</h{level}>")
+        elif line.startswith("> "):
+            out.append(f"<blockquote>{_inline(line[2:])}</blockquote>")
+        else:
+            out.append(f"<p>{_inline(line)}</p>")
+    if in_list:
+        out.append("</ul>")
+    return "\n".join(out)
+
+
+def post_key(r: Dict[str, Any]) -> str:
+    """Seri + derleme tarihi: aynı günün yeniden çalıştırması aynı yazıya karşılık gelir."""
+    return f"{r['series_key']}/{r['date']}"
+
+def _resolve_terms(session, wp_url: str, taxonomy: str, names: List[str], cache: Dict[str, int], workers: int) -> None:
+    """names içindeki her ad için cache'e id yerleştirir (gerekirse çekip/oluşturur)."""
+    wanted = {n.strip().lower(): n.strip() for n in names if n and n.strip()}
+    if all(k in cache for k in wanted):
+        return
+    cache.update(list_terms(session, wp_url, taxonomy))
+
+    missing = [wanted[k] for k in wanted if k not in cache]
+    if not missing:
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        ids = list(pool.map(lambda n: create_term(session, wp_url, taxonomy, n), missing))
+    for name, term_id in zip(missing, ids):
+        cache[name.lower()] = term_id
+    print(f"[WP] {taxonomy}: {len(missing)} yeni terim oluşturuldu.")
+
+
+def publish_reports(cfg: Dict[str, Any], series_reports: List[Dict[str, Any]], cache_path: str = WP_CACHE_FILE) -> None:
+    wp_cfg = cfg.get("wordpress", {})
+    wp_url = (os.environ.get("WP_URL") or wp_cfg.get("url") or "").strip()
+    user = (os.environ.get("WP_USER") or "").strip()
+    app_pass = (os.environ.get("WP_APP_PASS") or "").strip()
+    if not (wp_url and user and app_pass):
+        raise ValueError("WP_URL/WP_USER/WP_APP_PASS eksik. GitHub Secrets/Vars kontrol et.")
+
+    workers = int(wp_cfg.get("workers", 4))
+    series_cfg = {s.get("key", "series"): s for s in cfg.get("series", [])}
+    all_caches = load_wp_cache(cache_path)
+    cache = all_caches.setdefault(wp_url.rstrip("/"), {})
+    for k in ("categories", "tags", "posts"):
+        cache.setdefault(k, {})
+
+    todo = []
+    for r in series_reports:
+        key = post_key(r)
+        if key in cache["posts"]:
+            print(f"[WP] {r['series_key']} zaten yayında (post {cache['posts'][key]}).")
+            continue
+        s_wp = series_cfg.get(r["series_key"], {}).get("wordpress", {})
+        todo.append({
+            "report": r,
+            "category": s_wp.get("category") or wp_cfg.get("category") or series_cfg.get(r["series_key"], {}).get("title_prefix", ""),
+            "tags": list(s_wp.get("tags", wp_cfg.get("tags", []))),
+        })
+    if not todo:
+        return
+
+    session = wp_session(user, app_pass, pool_size=workers)
+    try:
+        _resolve_terms(session, wp_url, "categories", [t["category"] for t in todo], cache["categories"], workers)
+        _resolve_terms(session, wp_url, "tags", [tag for t in todo for tag in t["tags"]], cache["tags"], workers)
+
+        def publish(t):
+            r = t["report"]
+            content = markdown_to_html(r["markdown"])
+            categories = [cache["categories"][t["category"].strip().lower()]] if t["category"].strip() else None
+            tags = [cache["tags"][tag.strip().lower()] for tag in t["tags"] if tag.strip()] or None
+            return wp_create_post_with_session(session, wp_url, r["series_title"], content,
+                                               status=wp_cfg.get("status", "draft"),
+                                               categories=categories, tags=tags)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [(t["report"], pool.submit(publish, t)) for t in todo]
+            for r, fut in futures:
+                try:
+                    post = fut.result()
+                except Exception as e:
+                    print(f"[WP] {r['series_key']} gönderilemedi:", e)
+                    continue
+                cache["posts"][post_key(r)] = post["id"]
+                print(f"[WP] {r['series_key']} yayınlandı: post {post['id']}")
+    finally:
+        session.close()
+        save_wp_cache(all_caches, cache_path)
@@ -1,5 +1,6 @@
 
 import base64
+import html
 import requests
 
 def _headers(user, app_pass):
@@ -46,3 +47,31 @@ def get_or_create_tag(wp_url, user, app_pass, name, create=True):
         raise RuntimeError(f"Tag create failed: {r2.status_code} {r2.text}")
     return r2.json()["id"]
 
+def list_terms(session, wp_url, taxonomy):
+    """
+    taxonomy ("categories" / "tags") altındaki tüm terimleri sayfalayarak çeker.
+    Dönüş: {küçük harfli ad: id}
+    """
+    api = wp_url.rstrip("/") + f"/wp-json/wp/v2/{taxonomy}"
+    out = {}
+    page = 1
+    while True:
+        r = session.get(api, params={"per_page": 100, "page": page, "_fields": "id,name"}, timeout=30)
+        r.raise_for_status()
+        for item in r.json():
+            out[html.unescape(item.get("name", "")).strip().lower()] = item["id"]
+        if page >= int(r.headers.get("X-WP-TotalPages", 1)):
+            break
+        page += 1
+    return out
+
+def create_term(session, wp_url, taxonomy, name):
+    api = wp_url.rstrip("/") + f"/wp-json/wp/v2/{taxonomy}"
+    r = session.post(api, json={"name": name}, timeout=30)
+    if r.status_code in (200, 201):
+        return r.json()["id"]
+    # Aynı anda başka bir çalıştırma oluşturduysa WP mevcut id'yi döndürür
+    data = r.json() if r.headers.get("Content-Type", "").startswith("application/json") else {}
+    if data.get("code") == "term_exists":
+        return data.get("data", {}).get("term_id")
+    raise RuntimeError(f"{taxonomy} create failed: {r.status_code} {r.text}")
@@ -0,0 +1,104 @@
+"""
+wp_stage yayın aşaması, yerel WP stand-in'ine (tests/wp_stub.py) karşı.
+
+Çalıştırma:
+    python -m pytest -q tests
+    python -m unittest discover -s tests -t .
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from src.wp_stage import publish_reports
+from tests.wp_stub import WPStub
+
+
+def make_reports(n):
+    return [{
+        "series_key": f"seri{i}",
+        "series_title": f"Seri {i} — Derleme (2026-10-18)",
+        "date": "2026-10-18",
+        "file_path": f"out/seri{i}/2026-10-18_yok.md",  # bilinçli olarak diskte yok
+        "markdown": f"# Seri {i}\n\n- **Kaynak:** https://example.org/{i}",
+    } for i in range(n)]
+
+def make_cfg(n, category="Fizyoterapi", tags=("fizyoterapi", "haftalık")):
+    return {
+        "wordpress": {"category": category, "tags": list(tags), "workers": 4},
+        "series": [{"key": f"seri{i}"} for i in range(n)],
+    }
+
+
+class PublishReportsTest(unittest.TestCase):
+    def setUp(self):
+        categories = [(i, f"Kategori {i}") for i in range(1, 151)] + [(999, "Bel Ağrısı & Omurga")]
+        self.stub = WPStub(categories=categories, tags=[(5000, "fizyoterapi")])
+        url = self.stub.start()
+        self.addCleanup(self.stub.stop)
+
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.cache_path = os.path.join(self.tmp, "_wordpress", "wp_cache.json")
+
+        env = mock.patch.dict(os.environ, {"WP_URL": url, "WP_USER": "u", "WP_APP_PASS": "p"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def publish(self, cfg, reports):
+        publish_reports(cfg, reports, cache_path=self.cache_path)
+
+    def test_prefetch_paginates_and_unescapes_existing_terms(self):
+        self.publish(make_cfg(1, category="Bel Ağrısı & Omurga", tags=["fizyoterapi"]), make_reports(1))
+
+        # 151 kategori, sayfa başına 100 → 2 sayfa; "&amp;" çözülür, yeni terim oluşturulmaz
+        self.assertEqual(self.stub.count("GET", "categories"), 2)
+        self.assertEqual(self.stub.count("POST", "categories"), 0)
+        self.assertEqual(self.stub.count("POST", "tags"), 0)
+        post = self.stub.db["posts"][0]
+        self.assertEqual(post["categories"], [999])
+        self.assertEqual(post["tags"], [5000])
+        self.assertIn("<h1>Seri 0</h1>", post["content"])
+
+    def test_requests_grow_linearly_with_series(self):
+        self.publish(make_cfg(3), make_reports(3))
+        small = len(self.stub.requests)
+
+        other = WPStub(categories=[(i, f"Kategori {i}") for i in range(1, 151)], tags=[(5000, "fizyoterapi")])
+        with mock.patch.dict(os.environ, {"WP_URL": other.start()}):
+            try:
+                publish_reports(make_cfg(9), make_reports(9), cache_path=os.path.join(self.tmp, "other.json"))
+            finally:
+                other.stop()
+
+        # Terimler seri sayısından bağımsız olarak bir kez çekilir/oluşturulur; fark yalnızca yazılar.
+        self.assertEqual(len(other.requests) - small, 6)
+        self.assertEqual(other.count("POST", "posts"), 9)
+        self.assertEqual(other.count("POST", "categories") + other.count("POST", "tags"), 2)
+
+    def test_rerun_is_idempotent_without_requests(self):
+        cfg, reports = make_cfg(4), make_reports(4)
+        self.publish(cfg, reports)
+        first = len(self.stub.requests)
+
+        # Aynı gün yeniden çalıştırma: dosya adı (zaman damgası) değişse de aynı yazılar
+        for r in reports:
+            r["file_path"] = r["file_path"].replace("_yok", "_yeniden")
+        self.publish(cfg, reports)
+
+        self.assertEqual(len(self.stub.requests), first)
+        self.assertEqual(len(self.stub.db["posts"]), 4)
+
+    def test_existing_term_created_concurrently_is_reused(self):
+        # Önbellek ve liste "yeni" terimi görmeden başka bir çalıştırma onu oluşturmuş olsun.
+        real_list = self.stub.db["tags"][:]
+        self.stub.db["tags"].append({"id": 7000, "name": "haftalık"})
+        with mock.patch("src.wp_stage.list_terms", return_value={t["name"]: t["id"] for t in real_list}):
+            self.publish(make_cfg(1), make_reports(1))
+
+        self.assertIn(7000, self.stub.db["posts"][0]["tags"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Yerel WordPress REST stand-in'i (yalnızca wp_stage'in kullandığı uçlar).
+
+- GET  /wp-json/wp/v2/{categories,tags}?per_page=&page=   sayfalı liste, X-WP-TotalPages başlığı
+- POST /wp-json/wp/v2/{categories,tags}                   yeni terim; varsa 400 term_exists
+- POST /wp-json/wp/v2/posts                               yeni yazı
+Terim adları WordPress gibi HTML-escape'li saklanır ("&" → "&amp;").
+Her istek self.requests içine (yöntem, yol) olarak yazılır.
+"""
+import html
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+API = "/wp-json/wp/v2/"
+
+
+class WPStub:
+    def __init__(self, categories=(), tags=()):
+        self.db = {
+            "categories": [{"id": i, "name": html.escape(n, quote=False)} for i, n in categories],
+            "tags": [{"id": i, "name": html.escape(n, quote=False)} for i, n in tags],
+            "posts": [],
+        }
+        self.requests = []
+        self._lock = threading.Lock()
+        self._next_id = 10000
+        self._server = None
+
+    def start(self) -> str:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def count(self, method: str, resource: str) -> int:
+        return sum(1 for m, path in self.requests if m == method and path == API + resource)
+
+    def _create(self, resource, body):
+        with self._lock:
+            self._next_id += 1
+            item = {"id": self._next_id, **body}
+            self.db[resource].append(item)
+            return item
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, code, obj, headers=None):
+                body = json.dumps(obj).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _route(self, method):
+                u = urlparse(self.path)
+                stub.requests.append((method, u.path))
+                if not (self.headers.get("Authorization") or "").startswith("Basic "):
+                    self._send(401, {"code": "rest_not_logged_in"})
+                    return None, None
+                resource = u.path[len(API):] if u.path.startswith(API) else ""
+                if resource not in stub.db:
+                    self._send(404, {"code": "rest_no_route"})
+                    return None, None
+                return resource, parse_qs(u.query)
+
+            def do_GET(self):
+                resource, q = self._route("GET")
+                if resource is None:
+                    return
+                per_page = int(q.get("per_page", ["10"])[0])
+                page = int(q.get("page", ["1"])[0])
+                items = stub.db[resource]
+                pages = max(1, -(-len(items) // per_page))
+                self._send(200, items[(page - 1) * per_page:page * per_page], {"X-WP-TotalPages": str(pages)})
+
+            def do_POST(self):
+                resource, _ = self._route("POST")
+                if resource is None:
+                    return
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if resource == "posts":
+                    self._send(201, stub._create("posts", body))
+                    return
+                name = html.escape(body["name"].strip(), quote=False)
+                for term in stub.db[resource]:
+                    if term["name"].lower() == name.lower():
+                        self._send(400, {"code": "term_exists", "data": {"status": 400, "term_id": term["id"]}})
+                        return
+                self._send(201, stub._create(resource, {"name": name}))
+
+        return Handler